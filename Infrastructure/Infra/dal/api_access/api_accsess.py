@@ -1,11 +1,276 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+
 import aiohttp
 
+from Infrastructure.Infra.dal.api_access.cassette import Cassette
+from Infrastructure.Infra.dal.api_access.http_metrics import HttpMetrics
+from Infrastructure.Infra.dal.api_access.rate_limiter import SharedTokenBucket
+from Infrastructure.Infra.dal.api_access.resilience import CircuitBreaker, ResilienceStats, RetryPolicy, TimeoutSettings
+from Infrastructure.Infra.dal.api_access.response_cache import CachedResponse, ResponseCache
+from Infrastructure.Infra.utils.json_backend import loads
+from Infrastructure.Infra.utils.tracing import tracer
+
+
+@dataclass
+class ConnectionPoolSettings:
+    """Connection pool tuning for the shared aiohttp session."""
+    limit: int = 100
+    limit_per_host: int = 20
+    keepalive_timeout: float = 30.0
+    ttl_dns_cache: int = 300
+
+
+class ApiRequestError(Exception):
+    """Raised when a request does not come back with a 200 status."""
+
+    def __init__(self, url: str, status: int, retry_after: Optional[float] = None) -> None:
+        super().__init__(f"Error: Received status code {status} for GET request to {url}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(ApiRequestError):
+    """Raised without a network call while the circuit breaker for the upstream host is open."""
+
+    def __init__(self, url: str, retry_after: float) -> None:
+        super().__init__(url, 503, retry_after)
+        self.args = (f"Circuit open for GET request to {url}, next probe in {retry_after:.1f}s",)
+
 
 class ApiAccess:
-    @staticmethod
-    async def execute_get_request_async(url: str) -> dict:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
+    """aiohttp client that reuses one pooled ClientSession per event loop.
+
+    Network GETs go through a resilience layer: per-attempt and total timeouts, retries with
+    jittered back-off (honouring Retry-After) and a per-host circuit breaker. When a
+    rate_limiter is set, every request that reaches the network first takes one of its tokens.
+    Cassette replays and fresh response-cache entries are served before any of that.
+    Callers that run under a FetchScheduler pass retry_http_statuses=False: the scheduler
+    retries 429/5xx itself, so only transport errors and timeouts are retried here.
+    """
+
+    SERVER_ERROR_STATUSES = (500, 502, 503, 504)
+
+    pool_settings = ConnectionPoolSettings()
+    response_cache: Optional[ResponseCache] = None
+    cassette: Optional[Cassette] = None
+    retry_policy = RetryPolicy()
+    timeout_settings = TimeoutSettings()
+    circuit_breaker: Optional[CircuitBreaker] = CircuitBreaker()
+    resilience_stats = ResilienceStats()
+    rate_limiter: Optional[SharedTokenBucket] = None
+    http_metrics: Optional[HttpMetrics] = HttpMetrics()
+    retry_http_statuses = True
+    _sessions: "WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = WeakKeyDictionary()
+
+    def __init__(self, response_cache: Optional[ResponseCache] = None, cassette: Optional[Cassette] = None,
+                 retry_policy: Optional[RetryPolicy] = None, timeout_settings: Optional[TimeoutSettings] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 rate_limiter: Optional[SharedTokenBucket] = None,
+                 retry_http_statuses: Optional[bool] = None) -> None:
+        if response_cache is not None:
+            self.response_cache = response_cache
+        if cassette is not None:
+            self.cassette = cassette
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
+        if timeout_settings is not None:
+            self.timeout_settings = timeout_settings
+        if circuit_breaker is not None:
+            self.circuit_breaker = circuit_breaker
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        if retry_http_statuses is not None:
+            self.retry_http_statuses = retry_http_statuses
+
+    async def __aenter__(self) -> 'ApiAccess':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @classmethod
+    async def start(cls) -> aiohttp.ClientSession:
+        """Returns the session bound to the running loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        session = cls._sessions.get(loop)
+
+        if session is None or session.closed:
+            settings = cls.pool_settings
+            connector = aiohttp.TCPConnector(
+                limit=settings.limit,
+                limit_per_host=settings.limit_per_host,
+                keepalive_timeout=settings.keepalive_timeout,
+                ttl_dns_cache=settings.ttl_dns_cache,
+                use_dns_cache=True
+            )
+            trace_configs = [cls.http_metrics.trace_config()] if cls.http_metrics is not None else None
+            session = aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
+            cls._sessions[loop] = session
+
+        return session
+
+    @classmethod
+    async def close(cls) -> None:
+        """Closes the session bound to the running loop, if any."""
+        session = cls._sessions.pop(asyncio.get_running_loop(), None)
+
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def execute_get_request_async(self, url: str) -> Any:
+        return loads(await self.execute_get_request_raw_async(url))
+
+    async def execute_get_request_raw_async(self, url: str) -> bytes:
+        """Returns the raw response body, replayed from the cassette or response cache when configured."""
+        cassette = self.cassette
+
+        if cassette is not None and cassette.is_replaying:
+            interaction = cassette.play('GET', url)
+            if interaction is not None:
+                if interaction.status != 200:
+                    retry_after = self._parse_retry_after(interaction.headers.get('Retry-After'))
+                    raise ApiRequestError(url, interaction.status, retry_after)
+                return interaction.body
+
+        cache = self.response_cache
+        cached = await cache.get_async(url) if cache is not None else None
+
+        if cached is not None and cached.is_fresh(cache.ttl):
+            # No network needed, so an open circuit does not reject it and it is not counted as an attempt
+            body = cached.body
+        else:
+            try:
+                body = await self._get_resilient_async(url, cached)
+            except ApiRequestError as e:
+                if cassette is not None and cassette.is_recording:
+                    headers = {'Retry-After': str(e.retry_after)} if e.retry_after is not None else {}
+                    cassette.record('GET', url, e.status, b'', headers)
+                raise
+
+        if cassette is not None and cassette.is_recording:
+            cassette.record('GET', url, 200, body)
+
+        return body
+
+    async def _get_resilient_async(self, url: str, cached: Optional[CachedResponse] = None) -> bytes:
+        total = self.timeout_settings.total
+        if total is None:
+            return await self._get_with_retries_async(url, cached)
+
+        try:
+            return await asyncio.wait_for(self._get_with_retries_async(url, cached), total)
+        except asyncio.TimeoutError:
+            self.resilience_stats.timeouts += 1
+            self.resilience_stats.failures += 1
+            raise
+
+    async def _get_with_retries_async(self, url: str, cached: Optional[CachedResponse] = None) -> bytes:
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        stats = self.resilience_stats
+        host = urlsplit(url).netloc
+        attempt = 0
+
+        while True:
+            attempt += 1
+            if breaker is not None:
+                retry_in = breaker.check(host)
+                if retry_in is not None:
+                    stats.short_circuits += 1
+                    raise CircuitOpenError(url, retry_in)
+
+            stats.attempts += 1
+            try:
+                body = await self._get_raw_async(url, cached)
+            except ApiRequestError as e:
+                if breaker is not None:
+                    if e.status in self.SERVER_ERROR_STATUSES:
+                        breaker.record_failure(host)
+                    else:
+                        breaker.record_success(host)
+                if not (self.retry_http_statuses and policy.should_retry(attempt, e.status, e.retry_after)):
+                    stats.failures += 1
+                    raise
+                delay = policy.backoff(attempt, e.retry_after)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    stats.timeouts += 1
+                if breaker is not None:
+                    breaker.record_failure(host)
+                if not policy.should_retry(attempt):
+                    stats.failures += 1
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                if breaker is not None:
+                    breaker.record_success(host)
+                return body
+
+            stats.retries += 1
+            await asyncio.sleep(delay)
+
+    async def _get_raw_async(self, url: str, cached: Optional[CachedResponse] = None) -> bytes:
+        """One network GET, conditional on the stale cached entry if there is one."""
+        cache = self.response_cache
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        session = await self.start()
+        if self.rate_limiter is not None:
+            with tracer.span('rate_limiter.acquire', 'http'):
+                await self.rate_limiter.acquire()
+
+        with tracer.span('GET', 'http', url=url) as span:
+            started = time.perf_counter()
+            async with session.get(url, headers=headers, timeout=self.timeout_settings.client_timeout()) as response:
+                span['status'] = response.status
+                if response.status == 304 and cached is not None:
+                    await cache.touch_async(url)
+                    return cached.body
+
                 if response.status != 200:
-                    raise Exception(f"Error: Received status code {response.status} for GET request to {url}")
-                return await response.json()
+                    retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                    raise ApiRequestError(url, response.status, retry_after)
+
+                body_started = time.perf_counter()
+                body = await response.read()
+                span['bytes'] = len(body)
+                if self.http_metrics is not None:
+                    finished = time.perf_counter()
+                    self.http_metrics.record_response(finished - started, finished - body_started, len(body))
+
+                if cache is not None:
+                    await cache.put_async(url, body, response.headers.get('ETag'),
+                                          response.headers.get('Last-Modified'))
+
+                return body
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Converts a Retry-After header (seconds or HTTP date) to seconds from now."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,121 @@
+import base64
+import gzip
+import json
+import os
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+class CassetteMismatchError(Exception):
+    """Raised in strict replay mode when no recorded interaction matches a request."""
+
+
+@dataclass
+class Interaction:
+    method: str
+    url: str
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class Cassette:
+    """Gzipped JSON record of ApiAccess traffic, matched by method and URL on replay.
+
+    In 'record' mode every response is captured and the file is rewritten on save().
+    In 'replay' mode responses come from the file; a request with no recording raises
+    CassetteMismatchError when strict, or goes to the network and is appended when lenient.
+    Repeated requests for one key replay their recordings in order, then repeat the last one.
+    """
+
+    RECORD = 'record'
+    REPLAY = 'replay'
+
+    def __init__(self, path: str, mode: str = REPLAY, strict: bool = True) -> None:
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+
+        self.path = path
+        self.mode = mode
+        self.strict = strict
+        self.interactions: List[Interaction] = []
+        self._by_key: Dict[Tuple[str, str], List[Interaction]] = defaultdict(list)
+        self._cursors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._dirty = mode == self.RECORD
+        self._lock = threading.Lock()
+
+        if mode == self.REPLAY:
+            self.load()
+
+    @property
+    def is_replaying(self) -> bool:
+        return self.mode == self.REPLAY
+
+    @property
+    def is_recording(self) -> bool:
+        return self.mode == self.RECORD or not self.strict
+
+    def play(self, method: str, url: str) -> Optional[Interaction]:
+        key = (method.upper(), url)
+
+        with self._lock:
+            recorded = self._by_key.get(key)
+            if not recorded:
+                if self.strict:
+                    raise CassetteMismatchError(f"No recorded interaction for {method.upper()} {url} in {self.path}")
+                return None
+
+            cursor = self._cursors[key]
+            self._cursors[key] = cursor + 1
+
+            return recorded[min(cursor, len(recorded) - 1)]
+
+    def record(self, method: str, url: str, status: int, body: bytes, headers: Optional[Dict[str, str]] = None) -> None:
+        interaction = Interaction(method.upper(), url, status, body, dict(headers or {}))
+
+        with self._lock:
+            self.interactions.append(interaction)
+            self._by_key[(interaction.method, url)].append(interaction)
+            self._dirty = True
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            if self.strict:
+                raise FileNotFoundError(f"Cassette not found: {self.path}")
+            return
+
+        with gzip.open(self.path, 'rt', encoding='utf-8') as file:
+            document = json.load(file)
+
+        for entry in document['interactions']:
+            body = entry['body']
+            body = base64.b64decode(body) if entry.get('encoding') == 'base64' else body.encode('utf-8')
+            interaction = Interaction(entry['method'], entry['url'], entry['status'], body, entry.get('headers', {}))
+            self.interactions.append(interaction)
+            self._by_key[(interaction.method, interaction.url)].append(interaction)
+
+    def save(self) -> None:
+        """Writes the cassette if anything was recorded since it was loaded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = [self._to_entry(interaction) for interaction in self.interactions]
+            self._dirty = False
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with gzip.open(self.path, 'wt', encoding='utf-8') as file:
+            json.dump({'version': 1, 'interactions': entries}, file, separators=(',', ':'))
+
+    @staticmethod
+    def _to_entry(interaction: Interaction) -> Dict:
+        entry = {'method': interaction.method, 'url': interaction.url, 'status': interaction.status,
+                 'headers': interaction.headers}
+        try:
+            entry['body'] = interaction.body.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['body'] = base64.b64encode(interaction.body).decode('ascii')
+            entry['encoding'] = 'base64'
+
+        return entry
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+from Infrastructure.Infra.dal.api_access.api_accsess import ApiRequestError, CircuitOpenError
+from Infrastructure.Infra.utils.tracing import tracer
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchStats:
+    """Per-request latency and outcome counters collected by the FetchScheduler."""
+    latencies: List[float] = field(default_factory=list)
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    failures: int = 0
+
+    def record(self, latency: float) -> None:
+        self.requests += 1
+        self.latencies.append(latency)
+
+    def percentile(self, percent: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'throttled': self.throttled,
+            'failures': self.failures,
+            'p50_ms': round(self.percentile(50) * 1000, 2),
+            'p95_ms': round(self.percentile(95) * 1000, 2),
+            'max_ms': round(max(self.latencies, default=0.0) * 1000, 2)
+        }
+
+
+@dataclass
+class LoopSlots:
+    """The fetches a FetchScheduler has in flight on one event loop, and the condition they wait on."""
+    condition: asyncio.Condition = field(default_factory=asyncio.Condition)
+    in_flight: int = 0
+
+
+class FetchScheduler:
+    """Runs fetches under an adaptive concurrency cap.
+
+    The cap grows by one after a full window of successes and is halved whenever the
+    upstream answers 429 or 5xx, at which point every fetch pauses for Retry-After (or an
+    exponential, jittered back-off) before the failed request is retried. The cap and pauses
+    are shared, but every event loop using the scheduler counts its own in-flight fetches, so
+    a scheduler shared by two loops never resets or mixes up the other's counts.
+    """
+
+    THROTTLE_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_concurrency: int = 10, min_concurrency: int = 1, max_attempts: int = 4,
+                 base_backoff: float = 0.5, max_backoff: float = 30.0) -> None:
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.concurrency = max_concurrency
+        self.stats = FetchStats()
+        self._successes = 0
+        self._resume_at = 0.0
+        self._slots: "WeakKeyDictionary[asyncio.AbstractEventLoop, LoopSlots]" = WeakKeyDictionary()
+        self._slots_lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Fetches in flight on every loop."""
+        with self._slots_lock:
+            return sum(slots.in_flight for slots in self._slots.values())
+
+    async def run(self, func: Callable[[T], Awaitable[R]], items: Iterable[T]) -> List[R]:
+        """Applies func to every item under the scheduler and returns results in input order."""
+        results = await asyncio.gather(*(self.submit(func, item) for item in items))
+        logger.debug(f"Fetch scheduler stats: {self.stats.summary()}, concurrency: {self.concurrency}")
+
+        return results
+
+    async def submit(self, func: Callable[..., Awaitable[R]], *args: Any) -> R:
+        """Runs a single fetch, retrying it while the upstream is throttling."""
+        for attempt in range(1, self.max_attempts + 1):
+            with tracer.span('fetch_scheduler.acquire', 'scheduler', attempt=attempt):
+                await self._acquire()
+            started = time.perf_counter()
+
+            try:
+                result = await func(*args)
+            except ApiRequestError as e:
+                self.stats.record(time.perf_counter() - started)
+                # An open circuit already means the upstream is down, waiting on it would not fail fast
+                throttled = e.status in self.THROTTLE_STATUSES and not isinstance(e, CircuitOpenError)
+
+                if throttled:
+                    self._throttle(attempt, e.retry_after)
+                await self._release(success=False)
+
+                if not throttled or attempt == self.max_attempts:
+                    self.stats.failures += 1
+                    raise
+                self.stats.retries += 1
+                continue
+            except BaseException:
+                self.stats.failures += 1
+                await self._release(success=False)
+                raise
+
+            self.stats.record(time.perf_counter() - started)
+            await self._release(success=True)
+
+            return result
+
+    def _get_slots(self) -> LoopSlots:
+        loop = asyncio.get_running_loop()
+
+        with self._slots_lock:
+            slots = self._slots.get(loop)
+            if slots is None:
+                slots = self._slots[loop] = LoopSlots()
+
+        return slots
+
+    async def _acquire(self) -> None:
+        slots = self._get_slots()
+        condition = slots.condition
+
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            async with condition:
+                if slots.in_flight < self.concurrency and self._resume_at <= time.monotonic():
+                    slots.in_flight += 1
+                    return
+                await condition.wait()
+
+    async def _release(self, success: bool) -> None:
+        slots = self._get_slots()
+        condition = slots.condition
+
+        async with condition:
+            slots.in_flight -= 1
+
+            if success:
+                self._successes += 1
+                if self._successes >= self.concurrency and self.concurrency < self.max_concurrency:
+                    self.concurrency += 1
+                    self._successes = 0
+
+            # Wake only as many waiters as there are free slots to avoid a thundering herd
+            free_slots = self.concurrency - slots.in_flight
+            if free_slots > 0:
+                condition.notify(free_slots)
+
+    def _throttle(self, attempt: int, retry_after: Optional[float]) -> None:
+        self.stats.throttled += 1
+        self._successes = 0
+
+        # Responses to requests sent before the pause began are one signal, not several
+        if time.monotonic() >= self._resume_at:
+            self.concurrency = max(self.min_concurrency, self.concurrency // 2)
+
+        if retry_after is None:
+            retry_after = min(self.max_backoff, self.base_backoff * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+        self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
@@ -0,0 +1,179 @@
+import time
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import aiohttp
+
+
+class LatencyHistogram:
+    """HDR-style histogram of durations with about 1.5% relative precision.
+
+    Values are stored in microseconds across log-linear buckets: exact below 128us, then
+    64 sub-buckets per power of two. Memory is bounded by the range of the values, not by
+    how many are recorded, and two histograms can be merged exactly.
+    """
+
+    SUB_BUCKET_BITS = 7
+    _HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+    def __init__(self) -> None:
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        index = self._index(max(0, int(seconds * 1_000_000)))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float:
+        """Returns the highest value equivalent to the given percentile, in seconds."""
+        if not self.count:
+            return 0.0
+
+        rank = max(1, int(round(percent / 100 * self.count)))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self.max, self._highest_value(index) / 1_000_000)
+
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(50) * 1000, 3),
+            'p95_ms': round(self.percentile(95) * 1000, 3),
+            'p99_ms': round(self.percentile(99) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3)
+        }
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        if value < 2 * cls._HALF:
+            return value
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS
+        return shift * cls._HALF + (value >> shift)
+
+    @classmethod
+    def _highest_value(cls, index: int) -> int:
+        if index < 2 * cls._HALF:
+            return index
+        shift = index // cls._HALF - 1
+        return ((index - shift * cls._HALF + 1) << shift) - 1
+
+
+class HttpMetrics:
+    """Per-phase request timings collected through aiohttp's TraceConfig signals.
+
+    connect covers TCP and TLS together: aiohttp reports a new connection as a single step.
+    ttfb runs from the request headers being sent to the response headers arriving. body_read
+    and total (request start to last body byte) are reported by ApiAccess, which reads the
+    payload.
+    """
+
+    PHASES = ('pool_wait', 'dns', 'connect', 'ttfb', 'body_read', 'total')
+
+    def __init__(self) -> None:
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.histograms = {phase: LatencyHistogram() for phase in self.PHASES}
+        self.requests = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    def merge(self, other: 'HttpMetrics') -> None:
+        for phase, histogram in other.histograms.items():
+            self.histograms[phase].merge(histogram)
+        self.requests += other.requests
+        self.errors += other.errors
+        self.bytes_received += other.bytes_received
+        self.connections_created += other.connections_created
+        self.connections_reused += other.connections_reused
+
+    def record_response(self, total: float, body_read: float, size: int) -> None:
+        self.histograms['total'].record(total)
+        self.histograms['body_read'].record(body_read)
+        self.bytes_received += size
+
+    @property
+    def connection_reuse_ratio(self) -> float:
+        connections = self.connections_created + self.connections_reused
+        return self.connections_reused / connections if connections else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'bytes_received': self.bytes_received,
+            'connection_reuse_ratio': round(self.connection_reuse_ratio, 3),
+            **{phase: histogram.summary() for phase, histogram in self.histograms.items() if histogram.count}
+        }
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_queued_start.append(self._on_phase_start('pool_wait'))
+        trace_config.on_connection_queued_end.append(self._on_phase_end('pool_wait'))
+        trace_config.on_dns_resolvehost_start.append(self._on_phase_start('dns'))
+        trace_config.on_dns_resolvehost_end.append(self._on_phase_end('dns'))
+        trace_config.on_connection_create_start.append(self._on_phase_start('connect'))
+        trace_config.on_connection_create_end.append(self._on_connection_created)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+        trace_config.on_request_headers_sent.append(self._on_phase_start('ttfb'))
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+
+        return trace_config
+
+    async def _on_request_start(self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+        context.started = {}
+
+    def _on_phase_start(self, phase: str):
+        async def on_start(session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+            context.started[phase] = time.perf_counter()
+        return on_start
+
+    def _on_phase_end(self, phase: str):
+        async def on_end(session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+            self._stop(context, phase)
+        return on_end
+
+    async def _on_connection_created(self, session: aiohttp.ClientSession, context: SimpleNamespace,
+                                     params: Any) -> None:
+        self.connections_created += 1
+        self._stop(context, 'connect')
+
+    async def _on_connection_reused(self, session: aiohttp.ClientSession, context: SimpleNamespace,
+                                    params: Any) -> None:
+        self.connections_reused += 1
+
+    async def _on_request_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+        self.requests += 1
+        self._stop(context, 'ttfb')
+
+    async def _on_request_exception(self, session: aiohttp.ClientSession, context: SimpleNamespace,
+                                    params: Any) -> None:
+        self.requests += 1
+        self.errors += 1
+
+    def _stop(self, context: SimpleNamespace, phase: str) -> None:
+        started = context.started.pop(phase, None)
+        if started is not None:
+            self.histograms[phase].record(time.perf_counter() - started)
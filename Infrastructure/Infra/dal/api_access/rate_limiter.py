@@ -0,0 +1,109 @@
+import asyncio
+import os
+import struct
+import threading
+import time
+from typing import Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# tokens, last refill (wall clock, comparable across processes)
+_STATE = struct.Struct('<dd')
+
+
+class SharedTokenBucket:
+    """Token-bucket rate limiter whose state lives in a small file shared by every process.
+
+    Each pytest-xdist worker opens the same state file and takes an exclusive lock on it for
+    the few microseconds needed to refill and take a token, so the workers together stay
+    under rate requests per second with bursts of at most capacity. A caller that finds the
+    bucket empty reserves its token anyway and sleeps outside the lock until it is due.
+    """
+
+    def __init__(self, path: str, rate: float, capacity: float = 1.0) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.path = path
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.acquired = 0
+        self.waited = 0.0
+        self._thread_lock = threading.Lock()
+        self._fd = -1
+        self._pid = -1
+
+    async def acquire(self) -> float:
+        """Takes one token, sleeping until it is available; returns the seconds waited."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return delay
+
+    def reserve(self) -> float:
+        """Takes one token now and returns how long the caller must wait before using it."""
+        with self._thread_lock:
+            fd = self._open()
+            self._lock(fd)
+            try:
+                tokens, updated = self._read(fd)
+                now = time.time()
+                tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate) - 1
+                self._write(fd, tokens, now)
+            finally:
+                self._unlock(fd)
+
+            delay = max(0.0, -tokens / self.rate)
+            self.acquired += 1
+            self.waited += delay
+
+        return delay
+
+    def close(self) -> None:
+        with self._thread_lock:
+            if self._fd >= 0 and self._pid == os.getpid():
+                os.close(self._fd)
+            self._fd = -1
+
+    def _open(self) -> int:
+        # A forked worker must not share the parent's descriptor, flock locks are per open file
+        if self._fd < 0 or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o666)
+            self._pid = os.getpid()
+
+        return self._fd
+
+    def _read(self, fd: int) -> Tuple[float, float]:
+        os.lseek(fd, 0, os.SEEK_SET)
+        data = os.read(fd, _STATE.size)
+        if len(data) < _STATE.size:
+            return self.capacity, time.time()
+
+        return _STATE.unpack(data)
+
+    @staticmethod
+    def _write(fd: int, tokens: float, updated: float) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, _STATE.pack(tokens, updated))
+
+    @staticmethod
+    def _lock(fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_LOCK, _STATE.size)
+
+    @staticmethod
+    def _unlock(fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, _STATE.size)
@@ -0,0 +1,121 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+
+@dataclass
+class RetryPolicy:
+    """Retry rules for idempotent GETs: which failures to retry and how long to back off."""
+    max_attempts: int = 3
+    base_backoff: float = 0.2
+    max_backoff: float = 10.0
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    # A Retry-After longer than this is surfaced to the caller instead of slept through
+    max_retry_after: float = 30.0
+
+    def should_retry(self, attempt: int, status: Optional[int] = None, retry_after: Optional[float] = None) -> bool:
+        if attempt >= self.max_attempts:
+            return False
+        if status is not None and status not in self.retry_statuses:
+            return False
+        return retry_after is None or retry_after <= self.max_retry_after
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before the next attempt: Retry-After when given, else full-jitter exponential."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.base_backoff * 2 ** (attempt - 1)))
+
+
+@dataclass
+class TimeoutSettings:
+    """Time limits in seconds for one GET; None disables a limit."""
+    connect: Optional[float] = 10.0
+    request: Optional[float] = 30.0
+    # Covers every attempt of a request, back-off included
+    total: Optional[float] = 90.0
+
+    def client_timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(total=self.request, sock_connect=self.connect)
+
+
+@dataclass
+class ResilienceStats:
+    """Counters for the resilience layer of ApiAccess."""
+    attempts: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    short_circuits: int = 0
+    failures: int = 0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'attempts': self.attempts,
+            'retries': self.retries,
+            'timeouts': self.timeouts,
+            'short_circuits': self.short_circuits,
+            'failures': self.failures
+        }
+
+
+@dataclass
+class _Circuit:
+    state: str = 'closed'
+    failures: int = 0
+    # When the circuit opened, or when the current half-open probe was let through
+    since: float = 0.0
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker.
+
+    After failure_threshold consecutive failures the host's circuit opens and calls are
+    rejected without touching the network. Once reset_timeout has passed a single probe is
+    let through: its success closes the circuit, its failure opens it again. A probe that
+    never reports back (a cancelled call) is replaced after another reset_timeout.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def state(self, host: str) -> str:
+        return self._circuits.get(host, _Circuit()).state
+
+    def check(self, host: str) -> Optional[float]:
+        """Returns None when a call to host may proceed, else the seconds until the next probe."""
+        circuit = self._circuits.get(host)
+        if circuit is None or circuit.state == self.CLOSED:
+            return None
+
+        now = time.monotonic()
+        remaining = circuit.since + self.reset_timeout - now
+        if remaining > 0:
+            return remaining
+
+        circuit.state = self.HALF_OPEN
+        circuit.since = now
+
+        return None
+
+    def record_success(self, host: str) -> None:
+        self._circuits.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        circuit = self._circuits.setdefault(host, _Circuit())
+        circuit.failures += 1
+
+        if circuit.state == self.HALF_OPEN or circuit.failures >= self.failure_threshold:
+            circuit.state = self.OPEN
+            circuit.since = time.monotonic()
+
+    def reset(self) -> None:
+        self._circuits.clear()
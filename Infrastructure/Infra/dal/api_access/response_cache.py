@@ -0,0 +1,135 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+
+class ResponseCache:
+    """Single-file SQLite store of GET response bodies keyed by URL.
+
+    Entries are served directly while younger than the TTL, revalidated with
+    ETag/Last-Modified once stale, and evicted least-recently-used first when the
+    stored bodies exceed max_bytes. WAL mode lets several xdist workers share the file.
+
+    Hits only read: their access times are kept in memory and written in one batch at
+    most every access_flush_interval seconds (and before any eviction), so concurrent
+    workers do not queue on the write lock. The *_async methods run the SQLite work on a
+    thread, keeping a busy database from blocking the event loop.
+    """
+
+    def __init__(self, path: str, ttl: float = 24 * 60 * 60, max_bytes: int = 64 * 1024 * 1024,
+                 access_flush_interval: float = 5.0) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.access_flush_interval = access_flush_interval
+        self._lock = threading.Lock()
+        self._pending_access: Dict[str, float] = {}
+        self._access_flushed_at = time.monotonic()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'url TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, '
+            'stored_at REAL NOT NULL, accessed_at REAL NOT NULL, size INTEGER NOT NULL)'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT body, etag, last_modified, stored_at FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._pending_access[url] = time.time()
+            if time.monotonic() - self._access_flushed_at >= self.access_flush_interval:
+                self._flush_access()
+
+        body, etag, last_modified, stored_at = row
+        return CachedResponse(url, body, etag, last_modified, stored_at)
+
+    def put(self, url: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses (url, body, etag, last_modified, stored_at, accessed_at, size) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (url, body, etag, last_modified, now, now, len(body))
+            )
+            self._evict()
+
+    async def get_async(self, url: str) -> Optional[CachedResponse]:
+        return await asyncio.to_thread(self.get, url)
+
+    async def put_async(self, url: str, body: bytes, etag: Optional[str] = None,
+                        last_modified: Optional[str] = None) -> None:
+        await asyncio.to_thread(self.put, url, body, etag, last_modified)
+
+    async def touch_async(self, url: str) -> None:
+        await asyncio.to_thread(self.touch, url)
+
+    def touch(self, url: str) -> None:
+        """Marks a stale entry fresh again after the server confirmed it with 304 Not Modified."""
+        now = time.time()
+        with self._lock:
+            self._pending_access.pop(url, None)
+            self._connection.execute(
+                'UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?', (now, now, url)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending_access.clear()
+            self._connection.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_access()
+            self._connection.close()
+
+    def _flush_access(self) -> None:
+        self._access_flushed_at = time.monotonic()
+        if not self._pending_access:
+            return
+
+        pending, self._pending_access = self._pending_access, {}
+        self._connection.executemany('UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE url = ?',
+                                     ((accessed_at, url) for url, accessed_at in pending.items()))
+
+    def _evict(self) -> None:
+        total, = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()
+        if total <= self.max_bytes:
+            return
+
+        # Recent hits must count before choosing what is least recently used
+        self._flush_access()
+        rows = self._connection.execute('SELECT url, size FROM responses ORDER BY accessed_at').fetchall()
+        evicted = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            total -= size
+
+        self._connection.executemany('DELETE FROM responses WHERE url = ?', evicted)
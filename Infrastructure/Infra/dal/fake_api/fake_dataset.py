@@ -0,0 +1,112 @@
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+FIRST_NAMES = ['Rick', 'Morty', 'Summer', 'Beth', 'Jerry', 'Birdperson', 'Squanchy', 'Mr. Poopybutthole',
+               'Unity', 'Gearhead', 'Krombopulos', 'Tammy', 'Abradolf', 'Noob-Noob', 'Scary', 'Evil']
+LAST_NAMES = ['Sanchez', 'Smith', 'Lincler', 'Goldenfold', 'Poopybutthole', 'Prime', 'Michael', 'Glootie',
+              'Terry', 'Gazorpian', 'Cronenberg', 'Shrimply', 'Fart', 'Plumbus']
+SPECIES = ['Human', 'Alien', 'Humanoid', 'Robot', 'Cronenberg', 'Mythological Creature', 'Animal', 'Disease']
+STATUSES = ['Alive', 'Dead', 'unknown']
+GENDERS = ['Male', 'Female', 'Genderless', 'unknown']
+LOCATIONS = ['Earth (C-137)', 'Earth (Replacement Dimension)', 'Citadel of Ricks', 'Bird World',
+             'Gazorpazorp', 'Purge Planet', 'Interdimensional Cable', 'Anatomy Park', 'Immortality Field Resort',
+             'Post-Apocalyptic Earth', 'Squanch Planet', 'Snake Planet', 'Planet Squanch', 'Alphabetrium']
+
+
+@dataclass
+class FakeCharacter:
+    id: int
+    name: str
+    status: str
+    species: str
+    gender: str
+    origin_id: Optional[int]
+    location_id: Optional[int]
+    episode_ids: List[int] = field(default_factory=list)
+    created: str = '2017-11-04T18:48:46.250Z'
+
+
+@dataclass
+class FakeEpisode:
+    id: int
+    name: str
+    air_date: str
+    episode: str
+    character_ids: List[int] = field(default_factory=list)
+    created: str = '2017-11-10T12:56:33.798Z'
+
+
+class FakeDataset:
+    """Deterministic stand-in for the Rick and Morty dataset, rendered against any base URL."""
+
+    def __init__(self, characters: List[FakeCharacter], episodes: List[FakeEpisode], locations: List[str]) -> None:
+        self.characters = characters
+        self.episodes = episodes
+        self.locations = locations
+
+    @classmethod
+    def generate(cls, characters: int = 826, episodes: int = 51, seed: int = 137) -> 'FakeDataset':
+        """Builds a dataset with the real API's proportions; the same seed yields the same data."""
+        rng = random.Random(seed)
+        fake_characters = [
+            FakeCharacter(
+                id=character_id,
+                name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                status=rng.choice(STATUSES),
+                species=rng.choice(SPECIES),
+                gender=rng.choice(GENDERS),
+                origin_id=rng.choice([None, rng.randrange(len(LOCATIONS)) + 1]),
+                location_id=rng.randrange(len(LOCATIONS)) + 1
+            )
+            for character_id in range(1, characters + 1)
+        ]
+
+        fake_episodes = []
+        for episode_id in range(1, episodes + 1):
+            season, number = divmod(episode_id - 1, 10)
+            cast = sorted(rng.sample(range(1, characters + 1), min(characters, rng.randint(5, 40))))
+            fake_episodes.append(FakeEpisode(
+                id=episode_id,
+                name=f"Episode {episode_id}",
+                air_date=f"December {number + 1}, {2013 + season}",
+                episode=f"S{season + 1:02d}E{number + 1:02d}",
+                character_ids=cast
+            ))
+            for character_id in cast:
+                fake_characters[character_id - 1].episode_ids.append(episode_id)
+
+        return cls(fake_characters, fake_episodes, list(LOCATIONS))
+
+    def render_character(self, character: FakeCharacter, base_url: str) -> Dict[str, Any]:
+        return {
+            'id': character.id,
+            'name': character.name,
+            'status': character.status,
+            'species': character.species,
+            'type': '',
+            'gender': character.gender,
+            'origin': self._render_location(character.origin_id, base_url),
+            'location': self._render_location(character.location_id, base_url),
+            'image': f"{base_url}character/avatar/{character.id}.jpeg",
+            'episode': [f"{base_url}episode/{episode_id}" for episode_id in character.episode_ids],
+            'url': f"{base_url}character/{character.id}",
+            'created': character.created
+        }
+
+    @staticmethod
+    def render_episode(episode: FakeEpisode, base_url: str) -> Dict[str, Any]:
+        return {
+            'id': episode.id,
+            'name': episode.name,
+            'air_date': episode.air_date,
+            'episode': episode.episode,
+            'characters': [f"{base_url}character/{character_id}" for character_id in episode.character_ids],
+            'url': f"{base_url}episode/{episode.id}",
+            'created': episode.created
+        }
+
+    def _render_location(self, location_id: Optional[int], base_url: str) -> Dict[str, str]:
+        if location_id is None:
+            return {'name': 'unknown', 'url': ''}
+        return {'name': self.locations[location_id - 1], 'url': f"{base_url}location/{location_id}"}
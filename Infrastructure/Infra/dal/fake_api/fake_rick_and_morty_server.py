@@ -0,0 +1,225 @@
+import asyncio
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+from Infrastructure.Infra.dal.fake_api.fake_dataset import FakeDataset
+
+NOT_FOUND_BODY = b'{"error":"There is nothing here"}'
+
+
+@dataclass
+class FakeServerSettings:
+    """Behaviour knobs of the fake server; every field can be changed while it is running."""
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    rate_limit: Optional[float] = None
+    rate_limit_burst: int = 10
+    seed: int = 137
+
+
+class FakeRickAndMortyServer:
+    """Local stand-in for rickandmortyapi.com serving /episode and /character from a FakeDataset.
+
+    Supports pagination, multi-ID lookups and ETag revalidation like the real API, plus
+    configurable latency, random error injection and a token-bucket rate limit answering
+    429 with Retry-After. The server runs on its own event loop thread, so it can be used
+    from sync and async tests alike; bodies are rendered once at start-up to keep it cheap.
+    """
+
+    PAGE_SIZE = 20
+    RESOURCES = ('character', 'episode')
+
+    def __init__(self, dataset: Optional[FakeDataset] = None, settings: Optional[FakeServerSettings] = None,
+                 host: str = '127.0.0.1', port: int = 0) -> None:
+        self.dataset = dataset or FakeDataset.generate()
+        self.host = host
+        self.port = port
+        self.base_url = ''
+        self.requests_by_path: Counter = Counter()
+        self._bodies: Dict[str, Dict[int, bytes]] = {}
+        self._pages: Dict[str, List[bytes]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._ready = threading.Event()
+        self._startup_error: Optional[BaseException] = None
+        self.reset(settings)
+
+    @property
+    def request_count(self) -> int:
+        return sum(self.requests_by_path.values())
+
+    def reset(self, settings: Optional[FakeServerSettings] = None) -> None:
+        """Restores settings (default ones unless given) and clears request counters and limiter state."""
+        self.settings = settings or FakeServerSettings()
+        self.requests_by_path.clear()
+        self._rng = random.Random(self.settings.seed)
+        self._tokens = float(self.settings.rate_limit_burst)
+        self._tokens_updated_at = time.monotonic()
+
+    def refresh(self) -> None:
+        """Re-renders every body after self.dataset was edited, as when the upstream publishes changes."""
+        self._render()
+
+    def start(self) -> str:
+        """Starts serving on a background thread and returns the API base URL."""
+        self._thread = threading.Thread(target=self._run, name='fake-rick-and-morty-api', daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+        if self._startup_error is not None:
+            raise self._startup_error
+        return self.base_url
+
+    def stop(self) -> None:
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'FakeRickAndMortyServer':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+        try:
+            self._loop.run_until_complete(self._start_app())
+        except BaseException as e:
+            self._startup_error = e
+            self._ready.set()
+            return
+
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self._runner.cleanup())
+        self._loop.close()
+
+    async def _start_app(self) -> None:
+        app = web.Application(middlewares=[self._simulate_upstream])
+        for resource in self.RESOURCES:
+            app.router.add_get(f"/api/{resource}", self._make_list_handler(resource))
+            app.router.add_get(f"/api/{resource}/", self._make_list_handler(resource))
+            app.router.add_get(f"/api/{resource}/{{ids}}", self._make_ids_handler(resource))
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+        self.port = self._runner.addresses[0][1]
+        self.base_url = f"http://{self.host}:{self.port}/api/"
+        self._render()
+
+    def _render(self) -> None:
+        records = {
+            'character': {c.id: self.dataset.render_character(c, self.base_url) for c in self.dataset.characters},
+            'episode': {e.id: self.dataset.render_episode(e, self.base_url) for e in self.dataset.episodes}
+        }
+
+        for resource, by_id in records.items():
+            self._bodies[resource] = {record_id: self._dump(record) for record_id, record in by_id.items()}
+            ordered = [by_id[record_id] for record_id in sorted(by_id)]
+            pages = max(1, -(-len(ordered) // self.PAGE_SIZE))
+            resource_url = f"{self.base_url}{resource}"
+
+            self._pages[resource] = [
+                self._dump({
+                    'info': {
+                        'count': len(ordered),
+                        'pages': pages,
+                        'next': f"{resource_url}?page={page + 1}" if page < pages else None,
+                        'prev': f"{resource_url}?page={page - 1}" if page > 1 else None
+                    },
+                    'results': ordered[(page - 1) * self.PAGE_SIZE:page * self.PAGE_SIZE]
+                })
+                for page in range(1, pages + 1)
+            ]
+
+    @web.middleware
+    async def _simulate_upstream(self, request: web.Request, handler) -> web.StreamResponse:
+        self.requests_by_path[request.path] += 1
+        settings = self.settings
+
+        if settings.rate_limit:
+            retry_after = self._take_token(settings)
+            if retry_after is not None:
+                return web.json_response({'error': 'Too Many Requests'}, status=429,
+                                         headers={'Retry-After': f"{retry_after:.3f}"})
+
+        if settings.latency or settings.latency_jitter:
+            await asyncio.sleep(settings.latency + self._rng.uniform(0, settings.latency_jitter))
+
+        if settings.error_rate and self._rng.random() < settings.error_rate:
+            return web.json_response({'error': 'Injected failure'}, status=settings.error_status)
+
+        return await handler(request)
+
+    def _take_token(self, settings: FakeServerSettings) -> Optional[float]:
+        now = time.monotonic()
+        self._tokens = min(float(settings.rate_limit_burst),
+                           self._tokens + (now - self._tokens_updated_at) * settings.rate_limit)
+        self._tokens_updated_at = now
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / settings.rate_limit
+
+    def _make_list_handler(self, resource: str):
+        async def handle(request: web.Request) -> web.Response:
+            try:
+                page = int(request.query.get('page', 1))
+            except ValueError:
+                page = 0
+
+            pages = self._pages[resource]
+            if not 1 <= page <= len(pages):
+                return self._json(request, NOT_FOUND_BODY, status=404)
+            return self._json(request, pages[page - 1])
+
+        return handle
+
+    def _make_ids_handler(self, resource: str):
+        async def handle(request: web.Request) -> web.Response:
+            raw_ids = request.match_info['ids'].strip('[]')
+            try:
+                ids = [int(raw_id) for raw_id in raw_ids.split(',') if raw_id.strip()]
+            except ValueError:
+                return self._json(request, NOT_FOUND_BODY, status=404)
+
+            bodies = self._bodies[resource]
+            if ',' not in raw_ids and ids:
+                body = bodies.get(ids[0])
+                if body is None:
+                    return self._json(request, b'{"error":"%s not found"}' % resource.capitalize().encode(), 404)
+                return self._json(request, body)
+
+            return self._json(request, b'[' + b','.join(bodies[i] for i in ids if i in bodies) + b']')
+
+        return handle
+
+    @staticmethod
+    def _json(request: web.Request, body: bytes, status: int = 200) -> web.Response:
+        etag = f'"{zlib.crc32(body):08x}-{len(body)}"'
+        if status == 200 and request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        return web.Response(body=body, status=status, content_type='application/json', headers={'ETag': etag})
+
+    @staticmethod
+    def _dump(record) -> bytes:
+        return json.dumps(record, separators=(',', ':')).encode()
@@ -0,0 +1,138 @@
+import json
+import logging
+import os
+import shutil
+import threading
+from typing import Dict, Optional
+
+from selenium.webdriver.chrome.service import Service as ChromeService
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
+
+logger = logging.getLogger(__name__)
+
+
+class ChromeDriverResolver:
+    """Finds the chromedriver binary once per process and remembers it on disk.
+
+    Resolved paths are kept in cache_dir/index.json keyed by the installed Chrome's major
+    version, so later sessions and xdist workers skip webdriver_manager's version lookup
+    entirely. In offline mode nothing is downloaded: the cached binary for the current major
+    version is used, then a chromedriver found on PATH.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cache_dir: Optional[str] = None, offline: bool = False) -> None:
+        self.cache_dir = os.path.abspath(cache_dir or os.path.join(os.path.expanduser('~'), '.cache', 'chromedriver'))
+        self.offline = offline
+        self._path: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> str:
+        with self._lock:
+            if self._path is None or not os.path.exists(self._path):
+                self._path = self._resolve()
+                logger.info(f"Using ChromeDriver from: {self._path}")
+            return self._path
+
+    def _resolve(self) -> str:
+        pinned = os.getenv('CHROMEDRIVER_PATH')
+        if pinned:
+            return pinned
+
+        major_version = self.chrome_major_version()
+        index = self._read_index()
+        cached = index.get(major_version) if major_version else None
+        if cached and os.path.exists(cached):
+            return cached
+
+        if self.offline:
+            on_path = shutil.which('chromedriver')
+            if on_path:
+                return on_path
+            raise FileNotFoundError(f"No cached ChromeDriver for Chrome {major_version or '(unknown version)'} "
+                                    f"in {self.cache_dir} and none on PATH, run once online to populate the cache")
+
+        path = ChromeDriverManager(cache_manager=DriverCacheManager(root_dir=self.cache_dir)).install()
+        if major_version:
+            index[major_version] = path
+            self._write_index(index)
+
+        return path
+
+    @staticmethod
+    def chrome_major_version() -> Optional[str]:
+        try:
+            version = ChromeDriverManager().driver.get_browser_version_from_os()
+        except Exception as e:
+            logger.warning(f"Could not detect the installed Chrome version: {e}")
+            return None
+
+        return version.split('.')[0] if version else None
+
+    def _read_index(self) -> Dict[str, str]:
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index: Dict[str, str]) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        # Written to a per-process temp file and swapped in, so concurrent workers never read half a file
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump(index, file)
+        os.replace(temporary_path, path)
+
+
+class SharedChromeService:
+    """One long-lived chromedriver process serving every browser session of a worker.
+
+    Sessions are created with webdriver.Remote(service_url) instead of webdriver.Chrome, so
+    opening a browser no longer starts (and quitting one no longer stops) a chromedriver.
+    """
+
+    def __init__(self, resolver: ChromeDriverResolver) -> None:
+        self.resolver = resolver
+        self._service: Optional[ChromeService] = None
+        self._lock = threading.Lock()
+
+    @property
+    def service_url(self) -> str:
+        return self.start().service_url
+
+    def start(self) -> ChromeService:
+        with self._lock:
+            if self._service is None or not self._is_running(self._service):
+                if self._service is not None:
+                    logger.warning("Shared ChromeDriver service stopped responding, restarting it")
+                    self._stop(self._service)
+                self._service = ChromeService(self.resolver.resolve())
+                self._service.start()
+                logger.info(f"Shared ChromeDriver service listening on {self._service.service_url}")
+
+            return self._service
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._service is not None:
+                self._stop(self._service)
+                self._service = None
+
+    @staticmethod
+    def _is_running(service: ChromeService) -> bool:
+        try:
+            service.assert_process_still_running()
+        except Exception:
+            return False
+        return service.is_connectable()
+
+    @staticmethod
+    def _stop(service: ChromeService) -> None:
+        try:
+            service.stop()
+        except Exception as e:
+            logger.error(f"Error stopping ChromeDriver service: {e}")
@@ -0,0 +1,128 @@
+import logging
+import time
+from typing import List, Optional, Tuple, Union
+
+from selenium.common import JavascriptException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+logger = logging.getLogger(__name__)
+
+# Runs in the page: answers at once if the locator already matches, otherwise a MutationObserver
+# re-checks on every DOM change and answers on the first match, or with null after timeoutMs.
+MUTATION_WAIT_SCRIPT = """
+var using = arguments[0], value = arguments[1], timeoutMs = arguments[2], findAll = arguments[3];
+var done = arguments[arguments.length - 1];
+
+function query() {
+    var nodes;
+    if (using === 'xpath') {
+        var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+    } else if (using === 'tag name') {
+        nodes = document.getElementsByTagName(value);
+    } else {
+        nodes = document.querySelectorAll(value);
+    }
+    if (!nodes.length) {
+        return null;
+    }
+    return findAll ? Array.prototype.slice.call(nodes) : nodes[0];
+}
+
+var found = query();
+if (found) {
+    done(found);
+    return;
+}
+
+var timer = null;
+var observer = new MutationObserver(function () {
+    var match = query();
+    if (match) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(match);
+    }
+});
+observer.observe(document.documentElement || document, {childList: true, subtree: true, attributes: true});
+timer = setTimeout(function () {
+    observer.disconnect();
+    done(null);
+}, timeoutMs);
+"""
+
+
+class MutationObserverWaiter:
+    """Waits for a locator inside the browser instead of polling it from Python.
+
+    One execute_async_script call installs a MutationObserver that answers the moment the
+    locator matches, so a wait costs one round trip and ends with the DOM change rather than
+    on the next 0.5s poll. Each call waits at most slice_seconds to stay under the session's
+    script timeout; a navigation in between starts a new wait on the new document. wait()
+    returns None when the locator cannot be handled in the page (link text, a JavaScript or
+    driver error), and the caller falls back to WebDriverWait polling.
+    """
+
+    slice_seconds = 10.0
+    enabled = True
+
+    # Strategies the page can answer, with the CSS Selenium itself sends for id, name and class name
+    _CSS_TRANSLATIONS = {
+        By.CSS_SELECTOR: '{}',
+        By.ID: '[id="{}"]',
+        By.NAME: '[name="{}"]',
+        By.CLASS_NAME: '.{}'
+    }
+    _NATIVE_STRATEGIES = (By.XPATH, By.TAG_NAME)
+
+    @classmethod
+    def supports(cls, by: object) -> bool:
+        return (cls.enabled and isinstance(by, tuple) and len(by) == 2
+                and (by[0] in cls._CSS_TRANSLATIONS or by[0] in cls._NATIVE_STRATEGIES))
+
+    @classmethod
+    def wait(cls, driver: WebDriver, by: Tuple[str, str], timeout: float = 30, find_all: bool = False
+             ) -> Optional[Union[WebElement, List[WebElement]]]:
+        """Returns the first match (every match with find_all), raising TimeoutException after timeout."""
+        if not cls.supports(by):
+            return None
+
+        using, value = cls._translate(by)
+        deadline = time.monotonic() + timeout
+        slice_seconds = cls.slice_seconds
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(f"Locator {by} did not match within {timeout}s")
+
+            try:
+                result = driver.execute_async_script(MUTATION_WAIT_SCRIPT, using, value,
+                                                     int(min(remaining, slice_seconds) * 1000), find_all)
+            except TimeoutException:
+                # The session's script timeout is shorter than our slice, wait in smaller steps
+                slice_seconds = max(0.5, slice_seconds / 2)
+                continue
+            except JavascriptException as e:
+                if 'unloaded' in str(e.msg):
+                    continue  # The page navigated away mid-wait, observe the new document
+                logger.debug(f"MutationObserver wait for {by} failed in the page, polling instead: {e.msg}")
+                return None
+            except WebDriverException as e:
+                logger.debug(f"MutationObserver wait for {by} failed, polling instead: {e.msg}")
+                return None
+
+            if result:
+                return result
+
+    @classmethod
+    def _translate(cls, by: Tuple[str, str]) -> Tuple[str, str]:
+        using, value = by
+        if using in cls._CSS_TRANSLATIONS:
+            return By.CSS_SELECTOR, cls._CSS_TRANSLATIONS[using].format(value)
+        return using, value
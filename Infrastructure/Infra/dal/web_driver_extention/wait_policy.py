@@ -0,0 +1,145 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+
+from selenium.common import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+@dataclass
+class WaitStats:
+    """Wait counters for one locator."""
+    waits: int = 0
+    timeouts: int = 0
+    polls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.waits if self.waits else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'waits': self.waits,
+            'timeouts': self.timeouts,
+            'polls': self.polls,
+            'mean_ms': round(self.mean_seconds * 1000, 1),
+            'max_ms': round(self.max_seconds * 1000, 1)
+        }
+
+
+@dataclass
+class WaitPolicy:
+    """How DriverEX waits: timeout, poll intervals and per-locator statistics.
+
+    Polling starts at initial_poll and grows by backoff up to max_poll, so a condition that is
+    already true costs no sleep and a slow one is not hammered. With adaptive on, the interval
+    for a locator is also capped at a fraction of its mean wait so far, so elements that
+    usually show up quickly are not overshot by a long poll. Timeouts can be overridden per call.
+    """
+
+    timeout: float = 30
+    initial_poll: float = 0.005
+    max_poll: float = 0.5
+    backoff: float = 2.0
+    adaptive: bool = True
+    ignored_exceptions: Tuple[Type[BaseException], ...] = (WebDriverException,)
+
+    # Fraction of a locator's mean wait used as its longest poll interval when adaptive, never
+    # below ADAPTIVE_FLOOR so a usually instant element does not get polled every few ms
+    ADAPTIVE_FRACTION = 0.25
+    ADAPTIVE_FLOOR = 0.05
+
+    def __post_init__(self) -> None:
+        self._stats: Dict[str, WaitStats] = {}
+        self._lock = threading.Lock()
+
+    def with_timeout(self, timeout: float) -> 'WaitPolicy':
+        """Returns a copy with another timeout that records into the same statistics."""
+        policy = replace(self, timeout=timeout)
+        policy._stats, policy._lock = self._stats, self._lock
+        return policy
+
+    def resolve_timeout(self, timeout: Optional[float] = None) -> float:
+        return self.timeout if timeout is None else timeout
+
+    def until(self, driver: WebDriver, condition: Callable[[WebDriver], Any], timeout: Optional[float] = None,
+              key: Optional[str] = None, message: str = '') -> Any:
+        """Calls condition(driver) until it returns a truthy value, like WebDriverWait.until."""
+        timeout = self.resolve_timeout(timeout)
+        deadline = time.monotonic() + timeout
+        interval = self.initial_poll
+        max_interval = self.max_interval(key)
+        polls = 0
+        last_error: Optional[BaseException] = None
+
+        try:
+            while True:
+                polls += 1
+                try:
+                    value = condition(driver)
+                    if value:
+                        return value
+                except self.ignored_exceptions as e:
+                    last_error = e
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(message or f"Condition not met within {timeout}s") from last_error
+
+                time.sleep(min(interval, remaining))
+                interval = min(interval * self.backoff, max_interval)
+        finally:
+            if key is not None:
+                with self._lock:
+                    self._stats.setdefault(key, WaitStats()).polls += polls
+
+    def max_interval(self, key: Optional[str] = None) -> float:
+        if not self.adaptive or key is None:
+            return self.max_poll
+        stats = self._stats.get(key)
+        if stats is None or not stats.waits:
+            return self.max_poll
+        return min(self.max_poll, max(self.ADAPTIVE_FLOOR, stats.mean_seconds * self.ADAPTIVE_FRACTION))
+
+    @contextmanager
+    def timed(self, key: str) -> Iterator[None]:
+        """Records how long the enclosed wait took for key, and whether it timed out."""
+        started = time.monotonic()
+        timed_out = False
+        try:
+            yield
+        except TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                stats = self._stats.setdefault(key, WaitStats())
+                stats.waits += 1
+                stats.timeouts += timed_out
+                stats.total_seconds += elapsed
+                stats.max_seconds = max(stats.max_seconds, elapsed)
+
+    @property
+    def stats(self) -> Dict[str, WaitStats]:
+        with self._lock:
+            return dict(self._stats)
+
+    def slowest(self, count: int = 10) -> List[Tuple[str, Dict[str, Any]]]:
+        """The locators with the most total wait time, for tuning slow pages."""
+        ranked = sorted(self.stats.items(), key=lambda item: item[1].total_seconds, reverse=True)
+        return [(key, stats.summary()) for key, stats in ranked[:count]]
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    @staticmethod
+    def locator_key(by: Any) -> str:
+        if isinstance(by, Sequence) and not isinstance(by, str) and len(by) == 2:
+            return f"{by[0]}={by[1]}"
+        return type(by).__name__
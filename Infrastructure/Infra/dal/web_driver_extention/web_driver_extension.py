@@ -1,30 +1,16 @@
-from typing import Any, List
+import time
+from typing import Any, Callable, List, Optional
 
-from selenium.common import StaleElementReferenceException, NoSuchElementException, ElementNotInteractableException, \
-    ElementNotVisibleException, ElementNotSelectableException, InvalidSelectorException, NoSuchFrameException, \
-    WebDriverException
+from selenium.common import StaleElementReferenceException, ElementNotInteractableException
 from selenium import webdriver
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.webdriver import WebDriver
-from time import sleep
 
 from Infrastructure.Infra.dal.string_extentions.string_extentions import is_null_or_empty
+from Infrastructure.Infra.dal.web_driver_extention.element_waiter import MutationObserverWaiter
+from Infrastructure.Infra.dal.web_driver_extention.wait_policy import WaitPolicy
 
 
-def ignore_exception_types():
-    return [
-        NoSuchElementException,
-        ElementNotInteractableException,
-        ElementNotVisibleException,
-        ElementNotSelectableException,
-        InvalidSelectorException,
-        NoSuchFrameException,
-        WebDriverException
-    ]
-
-    return ignore_exception
-
 class SearchElement(object):
     def __init__(self, by: tuple):
         self.by = by
@@ -35,20 +21,18 @@ class SearchElement(object):
             return element
 
         except StaleElementReferenceException:
-            sleep(0.3)
             return None
 
 class NavigateToUrl(object):
     def __init__(self, url: str):
         self.url = url
 
-    def __call__(self, driver: webdriver) -> None:
+    def __call__(self, driver: webdriver) -> bool:
         try:
             driver.get(self.url)
+            return True
         except StaleElementReferenceException:
-            sleep(0.3)
-
-        return None
+            return False
 
 class SearchElements(object):
     def __init__(self, by: tuple):
@@ -60,7 +44,6 @@ class SearchElements(object):
             return elements
 
         except StaleElementReferenceException:
-            sleep(0.3)
             return None
 
 class ScrollToElement(object):
@@ -71,7 +54,6 @@ class ScrollToElement(object):
         try:
             element = driver.find_element(*self.by)
             driver.execute_script("arguments[0]" + ".scrollIntoView(alignToTop = false);", element)
-            sleep(0.5)
             return element
         except ElementNotInteractableException as e:
             ScrollToElement(self.by)(driver)
@@ -96,7 +78,6 @@ class ForceClick(object):
             return element
 
         except StaleElementReferenceException:
-            sleep(0.3)
             return None
 
         except ElementNotInteractableException as e:
@@ -115,14 +96,12 @@ class SendsKeysAuto(object):
 
             if self.input_text != new_text:
                 element.clear()
-                sleep(0.01)
                 element.send_keys(self.input_text)
                 return False
             else:
                 return True
 
         except StaleElementReferenceException:
-            sleep(0.3)
             return False
 
 class GetElementText(object):
@@ -143,39 +122,56 @@ class GetElementText(object):
             return str(new_string)
 
         except StaleElementReferenceException:
-            sleep(0.3)
-
             return None
 
 class DriverEX:
+    # Global wait settings; tests may swap in their own policy, methods also take a per-call timeout
+    wait_policy = WaitPolicy()
+
+    @staticmethod
+    def search_element(driver: webdriver, by: tuple, timeout: Optional[float] = None) -> WebElement:
+        return DriverEX._wait(driver, by, SearchElement(by), timeout, use_observed=True)
 
     @staticmethod
-    def search_element(driver: webdriver, by: tuple) -> WebElement:
-        return (WebDriverWait(driver=driver, timeout=30, ignored_exceptions=ignore_exception_types())
-                .until(SearchElement(by)))
+    def navigate_to_url(driver: webdriver, url: str, timeout: Optional[float] = None) -> bool:
+        with DriverEX.wait_policy.timed('navigate_to_url'):
+            return DriverEX.wait_policy.until(driver, NavigateToUrl(url), timeout=timeout,
+                                              key='navigate_to_url')
 
     @staticmethod
-    def navigate_to_url(driver: webdriver, url: str) -> WebElement:
-        return (WebDriverWait(driver=driver, timeout=30, ignored_exceptions=ignore_exception_types())
-                .until(NavigateToUrl(url)))
+    def search_elements(driver: webdriver, by: tuple, timeout: Optional[float] = None) -> List[WebElement]:
+        return DriverEX._wait(driver, by, SearchElements(by), timeout, find_all=True, use_observed=True)
 
     @staticmethod
-    def search_elements(driver: webdriver, by: tuple) -> List[WebElement]:
-        return (WebDriverWait(driver=driver, timeout=30, ignored_exceptions=ignore_exception_types())
-                .until(SearchElements(by)))
+    def force_click(driver: WebDriver, by, timeout: Optional[float] = None) -> None:
+        DriverEX._wait(driver, by, ForceClick(by), timeout)
 
     @staticmethod
-    def force_click(driver: WebDriver, by) -> None:
-        force_click = ForceClick(by)
-        WebDriverWait(driver=driver, timeout=30, ignored_exceptions=ignore_exception_types()) \
-            .until(force_click)
+    def get_element_text(driver: webdriver, by: tuple, timeout: Optional[float] = None) -> str:
+        return DriverEX._wait(driver, by, GetElementText(by=by), timeout)
 
     @staticmethod
-    def get_element_text(driver: webdriver, by: tuple) -> str:
-        return (WebDriverWait(driver=driver, timeout=30, ignored_exceptions=ignore_exception_types())
-                .until(GetElementText(by=by)))
+    def send_keys_auto(driver: webdriver, by: tuple, input_text: str, timeout: Optional[float] = None) -> None:
+        DriverEX._wait(driver, by, SendsKeysAuto(by=by, input_text=input_text), timeout)
 
     @staticmethod
-    def send_keys_auto(driver: webdriver, by: tuple, input_text: str) -> None:
-        (WebDriverWait(driver=driver, timeout=30, ignored_exceptions=ignore_exception_types())
-         .until(SendsKeysAuto(by=by, input_text=input_text)))
+    def _wait(driver: webdriver, by, condition: Callable[[webdriver], Any], timeout: Optional[float] = None,
+              find_all: bool = False, use_observed: bool = False) -> Any:
+        """Lets the page signal when by appears, then polls condition under the wait policy.
+
+        After the MutationObserver wait the condition usually holds on its first call. With
+        use_observed the observed element(s) are returned directly instead.
+        """
+        policy = DriverEX.wait_policy
+        timeout = policy.resolve_timeout(timeout)
+        deadline = time.monotonic() + timeout
+        key = WaitPolicy.locator_key(by)
+
+        with policy.timed(key):
+            if MutationObserverWaiter.supports(by):
+                observed = MutationObserverWaiter.wait(driver, by, timeout=timeout, find_all=find_all)
+                if observed is not None and use_observed:
+                    return observed
+
+            return policy.until(driver, condition, timeout=max(0.0, deadline - time.monotonic()), key=key,
+                                message=f"Waiting for {key} timed out after {timeout}s")
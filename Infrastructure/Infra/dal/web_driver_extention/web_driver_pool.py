@@ -0,0 +1,262 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from selenium.common import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolStats:
+    """Lease counters for a WebDriverPool."""
+    created: int = 0
+    leased: int = 0
+    reused: int = 0
+    recycled: int = 0
+    unhealthy: int = 0
+
+
+class DriverLease:
+    """A WebDriver being acquired from a WebDriverPool on a background thread.
+
+    The caller keeps working (fetching API data, say) while Chrome starts, then joins with
+    result(). wrap, if given, is applied once to the driver handed out by result().
+    """
+
+    def __init__(self, pool: 'WebDriverPool', future: 'Future[WebDriver]',
+                 wrap: Optional[Callable[[WebDriver], Any]] = None) -> None:
+        self._pool = pool
+        self._future = future
+        self._wrap = wrap
+        self._wrapped: Any = None
+        self._released = False
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        driver = self._future.result(timeout)
+        if self._wrap is None:
+            return driver
+        if self._wrapped is None:
+            self._wrapped = self._wrap(driver)
+        return self._wrapped
+
+    def release(self, recycle: bool = False) -> None:
+        """Returns the driver to the pool, waiting for the launch to finish if it is still running."""
+        if self._released:
+            return
+        self._released = True
+
+        try:
+            driver = self._future.result()
+        except Exception:
+            return  # The launch failed, so there is nothing to give back
+        self._pool.release(driver, recycle)
+
+
+class WebDriverPool:
+    """Keeps up to size warm WebDriver sessions and leases them to tests one at a time.
+
+    A returned session is reset (extra tabs closed, cookies and web storage cleared, blank
+    page, window size restored) and goes back to the idle list. It is quit and replaced
+    instead once it has served max_uses leases, fails its health check, or cannot be reset.
+    """
+
+    BLANK_PAGE = 'about:blank'
+
+    def __init__(self, factory: Callable[[], WebDriver], size: int = 1, max_uses: int = 20,
+                 window_size: Tuple[int, int] = (1920, 1080),
+                 dispose: Optional[Callable[[WebDriver], None]] = None) -> None:
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.window_size = window_size
+        self.dispose = dispose or self._quit
+        self.stats = PoolStats()
+        self._idle: List[WebDriver] = []
+        self._uses: Dict[WebDriver, int] = {}
+        self._launching = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._launcher: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> 'WebDriverPool':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[WebDriver]:
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        except WebDriverException:
+            self.release(driver, recycle=True)
+            raise
+        except BaseException:
+            self.release(driver)
+            raise
+        else:
+            self.release(driver)
+
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver:
+        """Returns a healthy idle session, or a new one while the pool is below size."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("WebDriver pool is closed")
+
+                driver = self._idle.pop() if self._idle else None
+                if driver is None and len(self._uses) + self._launching >= self.size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"No WebDriver became free within {timeout}s")
+                    self._condition.wait(remaining)
+                    continue
+                if driver is None:
+                    # Reserve the slot before the slow launch so concurrent callers cannot overshoot size
+                    self._launching += 1
+
+            if driver is not None:
+                if self.is_healthy(driver):
+                    self.stats.leased += 1
+                    self.stats.reused += 1
+                    return driver
+                self.stats.unhealthy += 1
+                self._discard(driver)
+                continue
+
+            return self._launch()
+
+    def acquire_in_background(self, timeout: Optional[float] = None,
+                              wrap: Optional[Callable[[WebDriver], Any]] = None) -> DriverLease:
+        """Starts acquire() on a launcher thread and returns at once."""
+        with self._condition:
+            if self._launcher is None:
+                self._launcher = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix='webdriver-launch')
+            launcher = self._launcher
+
+        return DriverLease(self, launcher.submit(self.acquire, timeout), wrap)
+
+    def release(self, driver: WebDriver, recycle: bool = False) -> None:
+        """Returns a leased session; recycle=True quits it instead of keeping it warm."""
+        with self._condition:
+            uses = self._uses.get(driver, 0) + 1
+            self._uses[driver] = uses
+
+        if not recycle and not self._closed and uses < self.max_uses and self.reset(driver):
+            with self._condition:
+                self._idle.append(driver)
+                self._condition.notify()
+            return
+
+        self.stats.recycled += 1
+        self._discard(driver)
+
+    def reset(self, driver: WebDriver) -> bool:
+        """Clears per-test browser state; returns False when the session could not be reset."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            self._clear_storage(driver)
+            self._clear_cookies(driver)
+            driver.get(self.BLANK_PAGE)
+            driver.set_window_size(*self.window_size)
+            return True
+        except WebDriverException as e:
+            logger.warning(f"Could not reset WebDriver session, recycling it: {e}")
+            return False
+
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        try:
+            return driver.execute_script('return 1') == 1
+        except WebDriverException:
+            return False
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            launcher, self._launcher = self._launcher, None
+
+        # Let launches already under way finish so their browsers are quit below rather than leaked
+        if launcher is not None:
+            launcher.shutdown(wait=True, cancel_futures=True)
+
+        with self._condition:
+            drivers = list(self._uses)
+            self._idle.clear()
+            self._uses.clear()
+
+        for driver in drivers:
+            try:
+                self.dispose(driver)
+            except Exception as e:
+                logger.error(f"Error disposing pooled WebDriver: {e}")
+        logger.info(f"WebDriver pool closed: {self.stats}")
+
+    def _launch(self) -> WebDriver:
+        try:
+            driver = self.factory()
+            driver.set_window_size(*self.window_size)
+        except BaseException:
+            with self._condition:
+                self._launching -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._launching -= 1
+            self._uses[driver] = 0
+        self.stats.created += 1
+        self.stats.leased += 1
+
+        return driver
+
+    def _discard(self, driver: WebDriver) -> None:
+        with self._condition:
+            self._uses.pop(driver, None)
+            self._condition.notify()
+        try:
+            self.dispose(driver)
+        except Exception as e:
+            logger.error(f"Error disposing pooled WebDriver: {e}")
+
+    @staticmethod
+    def _clear_storage(driver: WebDriver) -> None:
+        # Web storage is per origin, so it has to be cleared while the test's page is still open
+        try:
+            driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+        except WebDriverException:
+            pass  # about:blank and some error pages have no storage
+
+    @staticmethod
+    def _clear_cookies(driver: WebDriver) -> None:
+        # Chrome can drop cookies of every domain at once; delete_all_cookies only covers the current one.
+        # The CDP command is sent by name so it also works for Remote sessions on a Chromium connection.
+        try:
+            driver.execute('executeCdpCommand', {'cmd': 'Network.clearBrowserCookies', 'params': {}})
+            return
+        except (WebDriverException, AssertionError) as e:
+            # AssertionError is how a non-Chromium connection rejects an unknown command
+            logger.warning(f"Could not clear cookies over CDP, only the current domain is cleared: {e}")
+        driver.delete_all_cookies()
+
+    @staticmethod
+    def _quit(driver: WebDriver) -> None:
+        driver.quit()
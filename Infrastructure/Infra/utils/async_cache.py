@@ -0,0 +1,127 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class AsyncSingleFlightCache(Generic[K, V]):
+    """Bounded LRU of loaded values where concurrent misses for a key share one in-flight load.
+
+    It may be shared by event loops on several threads: its bookkeeping is guarded by a lock,
+    and a load in flight on one loop is only joined by callers on that same loop.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._values: "OrderedDict[K, V]" = OrderedDict()
+        self._in_flight: Dict[K, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        async def load_one(_: List[K]) -> Dict[K, V]:
+            return {key: await loader()}
+
+        return (await self.get_or_load_many([key], load_one))[key]
+
+    async def get_or_load_many(self, keys: Iterable[K],
+                               loader: Callable[[List[K]], Awaitable[Dict[K, V]]]) -> Dict[K, V]:
+        """Returns the values for keys, loading only those neither cached nor already in flight.
+
+        Keys the loader does not return are left out of the result.
+        """
+        loop = asyncio.get_running_loop()
+        results: Dict[K, V] = {}
+        waiting: Dict[K, asyncio.Future] = {}
+        missing: Dict[K, asyncio.Future] = {}
+
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                if key in self._values:
+                    self.hits += 1
+                    self._values.move_to_end(key)
+                    results[key] = self._values[key]
+                    continue
+
+                future = self._in_flight.get(key)
+                if future is not None and future.get_loop() is loop:
+                    self.coalesced += 1
+                    waiting[key] = future
+                else:
+                    self.misses += 1
+                    # Claimed in the same locked pass, so no other caller starts a second load for it
+                    missing[key] = self._in_flight[key] = loop.create_future()
+
+        if missing:
+            results.update(await self._load(missing, loader))
+
+        retry: List[K] = []
+        for key, future in waiting.items():
+            try:
+                results[key] = await asyncio.shield(future)
+            except KeyError:
+                pass
+            except asyncio.CancelledError:
+                # The load we joined was cancelled by its owner; only re-raise if we were cancelled ourselves
+                if not future.cancelled():
+                    raise
+                retry.append(key)
+
+        if retry:
+            results.update(await self.get_or_load_many(retry, loader))
+
+        return results
+
+    async def _load(self, futures: Dict[K, asyncio.Future],
+                    loader: Callable[[List[K]], Awaitable[Dict[K, V]]]) -> Dict[K, V]:
+        try:
+            loaded = await loader(list(futures))
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except BaseException as e:
+            for future in futures.values():
+                future.set_exception(e)
+                future.exception()
+            raise
+        finally:
+            with self._lock:
+                for key, future in futures.items():
+                    if self._in_flight.get(key) is future:
+                        del self._in_flight[key]
+
+        results: Dict[K, V] = {}
+        for key, future in futures.items():
+            if key in loaded:
+                self.put(key, loaded[key])
+                results[key] = loaded[key]
+                future.set_result(loaded[key])
+            else:
+                future.set_exception(KeyError(key))
+                future.exception()
+
+        return results
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar
+
+R = TypeVar('R')
+
+
+class BackgroundEventLoop:
+    """An asyncio event loop running forever on a daemon thread.
+
+    Synchronous code hands coroutines to it with submit (a concurrent.futures.Future) or
+    run (blocks for the result), so every call shares the same loop and whatever is bound
+    to it, such as the pooled ApiAccess session, instead of starting a new loop per call.
+    """
+
+    def __init__(self, name: str = 'background-event-loop') -> None:
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'BackgroundEventLoop':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self.start()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if not self.is_running:
+                ready = threading.Event()
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run, args=(self._loop, ready), name=self.name,
+                                                daemon=True)
+                self._thread.start()
+                ready.wait()
+
+            return self._loop
+
+    def submit(self, coroutine: Coroutine[Any, Any, R]) -> 'Future[R]':
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: Coroutine[Any, Any, R], timeout: Optional[float] = None) -> R:
+        """Runs the coroutine on the background loop and blocks until it finishes."""
+        if self._loop is not None and self._is_loop_thread():
+            coroutine.close()
+            raise RuntimeError("run() called from the background loop itself would deadlock, await instead")
+
+        future = self.submit(coroutine)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def call(self, func: Callable[..., Awaitable[R]], *args: Any) -> R:
+        return self.run(func(*args))
+
+    def stop(self, cleanup: Optional[Callable[[], Awaitable[Any]]] = None, timeout: float = 10.0) -> None:
+        """Runs the optional cleanup coroutine on the loop, then stops the loop and joins its thread."""
+        with self._lock:
+            if not self.is_running:
+                return
+
+            loop, thread = self._loop, self._thread
+            try:
+                if cleanup is not None:
+                    asyncio.run_coroutine_threadsafe(cleanup(), loop).result(timeout)
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join(timeout)
+                if not thread.is_alive():
+                    loop.close()
+                self._loop = None
+                self._thread = None
+
+    def _is_loop_thread(self) -> bool:
+        return self._thread is threading.current_thread()
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
@@ -0,0 +1,112 @@
+import asyncio
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Awaitable, Callable, ContextManager, Dict, Iterator, List, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+R = TypeVar('R')
+
+
+class Tracer:
+    """Lightweight span recorder exporting Chrome trace-event JSON (chrome://tracing, Perfetto).
+
+    Each span becomes a complete ("X") event. Spans are laid out on one track per thread
+    and asyncio task, so concurrent HTTP calls show up side by side and nested spans of one
+    task stack under each other. A disabled tracer costs one attribute check per span.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._events: List[Dict[str, Any]] = []
+        # Tasks are keyed weakly: a finished task's id() can be reused by a new one
+        self._task_tracks: "WeakKeyDictionary[asyncio.Task, int]" = WeakKeyDictionary()
+        self._thread_tracks: Dict[int, int] = {}
+        self._track_count = 0
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    def span(self, name: str, category: str = 'pipeline', **args: Any) -> ContextManager[Dict[str, Any]]:
+        """Times the enclosed block; the yielded dict can be filled with extra args for the event."""
+        if not self.enabled:
+            return nullcontext({})
+        return self._span(name, category, args)
+
+    def traced(self, name: Optional[str] = None, category: str = 'pipeline'
+               ) -> Callable[[Callable[..., Awaitable[R]]], Callable[..., Awaitable[R]]]:
+        """Decorates a coroutine function so every call is recorded as a span."""
+        def decorator(func: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> R:
+                with self.span(span_name, category):
+                    return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        return list(self._events)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._task_tracks.clear()
+            self._thread_tracks.clear()
+
+    def export(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, file)
+
+    @contextmanager
+    def _span(self, name: str, category: str, args: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        track = self._track()
+        started_ns = time.perf_counter_ns()
+        try:
+            yield args
+        except BaseException as e:
+            args['error'] = type(e).__name__
+            raise
+        finally:
+            finished_ns = time.perf_counter_ns()
+            self._events.append({
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': (started_ns - self._origin_ns) / 1000,
+                'dur': (finished_ns - started_ns) / 1000,
+                'pid': self._pid,
+                'tid': track,
+                'args': args
+            })
+
+    def _track(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        tracks = self._task_tracks if task is not None else self._thread_tracks
+        key = task if task is not None else threading.get_ident()
+
+        track = tracks.get(key)
+        if track is None:
+            with self._lock:
+                self._track_count += 1
+                track = tracks[key] = self._track_count
+                thread_name = threading.current_thread().name
+                self._events.append({
+                    'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': track,
+                    'args': {'name': f"{thread_name} / {task.get_name()}" if task is not None else thread_name}
+                })
+
+        return track
+
+
+# Process-wide tracer used by the API client and pipeline; enabled by conftest when TRACE_PATH is set
+tracer = Tracer()
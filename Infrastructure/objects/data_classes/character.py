@@ -1,8 +1,8 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import List, Mapping, Optional, Tuple, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     id: int
     name: str
@@ -25,3 +25,23 @@ class Character:
 
         if not self.episode:
             self.episode = []
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenCharacter:
+    """Immutable Character, for data that is shared across tests and must not be mutated.
+
+    ModelDecoder(frozen=True) fills it with a tuple of episodes and read-only place mappings;
+    the places are left out of the hash, which the other fields already make unique.
+    """
+    id: int
+    name: str
+    status: str
+    species: str
+    gender: str
+    origin: Optional[Mapping[str, str]] = field(hash=False)
+    location: Optional[Union[str, Mapping[str, str]]] = field(hash=False)
+    image: str
+    episode: Tuple[str, ...]
+    url: str
+    created: str
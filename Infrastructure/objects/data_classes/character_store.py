@@ -0,0 +1,138 @@
+import random
+from array import array
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from Infrastructure.objects.data_classes.character import Character
+
+
+class CharacterStore:
+    """Columnar in-memory character table with hash indexes for the common test queries.
+
+    Each field lives in its own column and rows are addressed by position. location,
+    species and status are indexed to row lists, as is episode membership, so lookups
+    cost O(1) plus the size of the answer instead of a scan over every character.
+    """
+
+    INDEXED_FIELDS = ('location', 'species', 'status')
+
+    def __init__(self) -> None:
+        self._ids = array('l')
+        self._names: List[str] = []
+        self._statuses: List[str] = []
+        self._species: List[str] = []
+        self._genders: List[str] = []
+        self._origins: List[Any] = []
+        self._locations: List[Any] = []
+        self._images: List[str] = []
+        self._episodes: List[List[str]] = []
+        self._urls: List[str] = []
+        self._created: List[str] = []
+
+        self._row_by_id: Dict[int, int] = {}
+        self._indexes: Dict[str, Dict[str, List[int]]] = {name: defaultdict(list) for name in self.INDEXED_FIELDS}
+        self._episode_index: Dict[str, List[int]] = defaultdict(list)
+        # Locations holding two or more characters, kept as a list for O(1) random picks
+        self._shared_locations: List[str] = []
+
+    @classmethod
+    def from_characters(cls, characters: Iterable[Character]) -> 'CharacterStore':
+        store = cls()
+        store.extend(characters)
+        return store
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, character_id: int) -> bool:
+        return character_id in self._row_by_id
+
+    def add(self, character: Character) -> None:
+        """Adds a character; a character whose ID is already stored is ignored."""
+        if character.id in self._row_by_id:
+            return
+
+        row = len(self._ids)
+        self._row_by_id[character.id] = row
+        self._ids.append(character.id)
+        self._names.append(character.name)
+        self._statuses.append(character.status)
+        self._species.append(character.species)
+        self._genders.append(character.gender)
+        self._origins.append(character.origin)
+        self._locations.append(character.location)
+        self._images.append(character.image)
+        self._episodes.append(list(character.episode))
+        self._urls.append(character.url)
+        self._created.append(character.created)
+
+        location = self._place_name(character.location)
+        for name, value in (('location', location), ('species', character.species), ('status', character.status)):
+            self._indexes[name][value].append(row)
+
+        for episode_url in character.episode:
+            self._episode_index[episode_url].append(row)
+
+        if len(self._indexes['location'][location]) == 2:
+            self._shared_locations.append(location)
+
+    def extend(self, characters: Iterable[Character]) -> None:
+        for character in characters:
+            self.add(character)
+
+    def get(self, character_id: int) -> Character:
+        return self._materialize(self._row_by_id[character_id])
+
+    def ids_where(self, field: str, value: str) -> List[int]:
+        return [self._ids[row] for row in self._index(field).get(value, ())]
+
+    def characters_where(self, field: str, value: str) -> List[Character]:
+        return [self._materialize(row) for row in self._index(field).get(value, ())]
+
+    def group_by(self, field: str) -> Mapping[str, Tuple[int, ...]]:
+        """Returns a read-only snapshot of value -> character IDs; later adds do not show up in it."""
+        return MappingProxyType({value: tuple(self._ids[row] for row in rows)
+                                 for value, rows in self._index(field).items()})
+
+    def characters_in_episode(self, episode_url: str) -> List[Character]:
+        return [self._materialize(row) for row in self._episode_index.get(episode_url, ())]
+
+    def shared_locations(self) -> List[str]:
+        return list(self._shared_locations)
+
+    def random_pair_sharing_location(self, rng: Optional[random.Random] = None) -> Tuple[Character, Character]:
+        """Picks a location uniformly among those with two or more characters, then two of its characters."""
+        if not self._shared_locations:
+            raise LookupError("No location is shared by two characters")
+
+        rng = rng or random
+        location = self._shared_locations[rng.randrange(len(self._shared_locations))]
+        first, second = rng.sample(self._indexes['location'][location], 2)
+
+        return self._materialize(first), self._materialize(second)
+
+    def _index(self, field: str) -> Dict[str, List[int]]:
+        if field not in self._indexes:
+            raise KeyError(f"'{field}' is not indexed, expected one of {', '.join(self.INDEXED_FIELDS)}")
+        return self._indexes[field]
+
+    def _materialize(self, row: int) -> Character:
+        return Character(
+            id=self._ids[row],
+            name=self._names[row],
+            status=self._statuses[row],
+            species=self._species[row],
+            gender=self._genders[row],
+            origin=self._origins[row],
+            location=self._locations[row],
+            image=self._images[row],
+            episode=list(self._episodes[row]),
+            url=self._urls[row],
+            created=self._created[row]
+        )
+
+    @staticmethod
+    def _place_name(place: Any) -> str:
+        # Decoded characters carry the location name, hand-built ones may carry the API's {name, url} object
+        return place.get('name', 'unknown') if isinstance(place, Mapping) else place
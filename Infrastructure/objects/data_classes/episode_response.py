@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     id: int
     name: str
@@ -11,7 +11,17 @@ class Episode:
     url: str
     created: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class FrozenEpisode:
+    id: int
+    name: str
+    air_date: str
+    episode: str
+    characters: Tuple[str, ...]
+    url: str
+    created: str
+
+@dataclass(slots=True)
 class EpisodeResponse:
-    results: List[Episode]
+    results: List[Union[Episode, FrozenEpisode]]
     info: Dict[str, Optional[str]]
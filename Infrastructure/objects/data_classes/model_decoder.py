@@ -0,0 +1,138 @@
+from types import MappingProxyType
+from typing import Any, Dict, List, Tuple, Type, Union
+
+from Infrastructure.Infra.utils.json_backend import loads
+from Infrastructure.objects.data_classes.character import Character, FrozenCharacter
+from Infrastructure.objects.data_classes.episode_response import Episode, EpisodeResponse, FrozenEpisode
+
+# field name -> (expected type, required)
+CHARACTER_SCHEMA: Dict[str, Tuple[Type, bool]] = {
+    'id': (int, True),
+    'name': (str, True),
+    'status': (str, False),
+    'species': (str, False),
+    'gender': (str, False),
+    'origin': (dict, False),
+    'location': (dict, False),
+    'image': (str, False),
+    'episode': (list, False),
+    'url': (str, False),
+    'created': (str, False)
+}
+
+EPISODE_SCHEMA: Dict[str, Tuple[Type, bool]] = {
+    'id': (int, True),
+    'name': (str, True),
+    'air_date': (str, True),
+    'episode': (str, True),
+    'characters': (list, True),
+    'url': (str, True),
+    'created': (str, True)
+}
+
+UNKNOWN_PLACE = {"name": "unknown", "url": ""}
+
+AnyCharacter = Union[Character, FrozenCharacter]
+AnyEpisode = Union[Episode, FrozenEpisode]
+
+
+class SchemaError(ValueError):
+    """Raised when an API record does not match the expected schema."""
+
+
+class ModelDecoder:
+    """Decodes raw API responses straight into slotted Character/Episode instances.
+
+    With frozen=True the Frozen* types are built, and the JSON lists and objects inside them
+    are turned into tuples and read-only mappings so the records are truly immutable.
+    """
+
+    def __init__(self, frozen: bool = False, validate: bool = True) -> None:
+        self.frozen = frozen
+        self.character_type = FrozenCharacter if frozen else Character
+        self.episode_type = FrozenEpisode if frozen else Episode
+        self.validate = validate
+
+    @staticmethod
+    def loads(raw: Union[bytes, str]) -> Any:
+        return loads(raw)
+
+    def character(self, data: Dict[str, Any]) -> AnyCharacter:
+        if self.validate:
+            self._check(data, CHARACTER_SCHEMA, 'character')
+
+        location = data.get('location')
+        origin = data.get('origin') or dict(UNKNOWN_PLACE)
+        location = location['name'] if location else dict(UNKNOWN_PLACE)
+        episode = data.get('episode') or []
+        if self.frozen:
+            origin, location, episode = self._freeze(origin), self._freeze(location), self._freeze(episode)
+
+        return self.character_type(
+            id=data['id'],
+            name=data['name'],
+            status=data.get('status', 'unknown'),
+            species=data.get('species', 'unknown'),
+            gender=data.get('gender', 'unknown'),
+            origin=origin,
+            location=location,
+            image=data.get('image', 'unknown'),
+            episode=episode,
+            url=data.get('url', 'unknown'),
+            created=data.get('created', 'unknown')
+        )
+
+    def characters(self, raw: Union[bytes, str]) -> List[AnyCharacter]:
+        """Decodes a single character or a multi-ID list response."""
+        data = self.loads(raw)
+        if isinstance(data, dict):
+            data = [data]
+
+        return [self.character(item) for item in data]
+
+    def episode(self, data: Dict[str, Any]) -> AnyEpisode:
+        if self.validate:
+            self._check(data, EPISODE_SCHEMA, 'episode')
+
+        return self.episode_type(
+            id=data['id'],
+            name=data['name'],
+            air_date=data['air_date'],
+            episode=data['episode'],
+            characters=self._freeze(data['characters']) if self.frozen else data['characters'],
+            url=data['url'],
+            created=data['created']
+        )
+
+    def episode_page(self, data: Dict[str, Any]) -> EpisodeResponse:
+        if self.validate and (not isinstance(data.get('info'), dict) or not isinstance(data.get('results'), list)):
+            raise SchemaError("Episode page must have an 'info' object and a 'results' list")
+
+        return EpisodeResponse(results=[self.episode(item) for item in data['results']], info=data['info'])
+
+    def episode_response(self, raw: Union[bytes, str]) -> EpisodeResponse:
+        return self.episode_page(self.loads(raw))
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        if isinstance(value, dict):
+            return MappingProxyType(dict(value))
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    @staticmethod
+    def _check(data: Any, schema: Dict[str, Tuple[Type, bool]], kind: str) -> None:
+        if not isinstance(data, dict):
+            raise SchemaError(f"Expected a {kind} object, got {type(data).__name__}")
+
+        for name, (expected_type, required) in schema.items():
+            value = data.get(name)
+            if value is None:
+                if required:
+                    raise SchemaError(f"{kind} {data.get('id')} is missing required field '{name}'")
+                continue
+            # bool is an int subclass, but never a valid ID
+            if not isinstance(value, expected_type) or (expected_type is int and isinstance(value, bool)):
+                raise SchemaError(f"{kind} {data.get('id')} field '{name}' should be {expected_type.__name__}, "
+                                  f"got {type(value).__name__}")
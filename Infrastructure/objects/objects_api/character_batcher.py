@@ -0,0 +1,79 @@
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess
+from Infrastructure.Infra.dal.api_access.fetch_scheduler import FetchScheduler
+from Infrastructure.Infra.dal.data_reposetory.data_rep import DataRep
+from Infrastructure.Infra.utils.async_cache import AsyncSingleFlightCache
+from Infrastructure.Infra.utils.tracing import tracer
+from Infrastructure.objects.data_classes.model_decoder import AnyCharacter, ModelDecoder
+
+# (base URL, decoded character type, character ID)
+CharacterKey = Tuple[str, Type, int]
+
+
+class CharacterBatcher:
+    """Fetches characters through the multi-ID endpoint (/character/1,2,3) instead of one GET each.
+
+    Cache entries are keyed by base URL and decoded type as well as ID, so a cache shared by
+    several batchers never hands one a record from another API or built by another decoder.
+    """
+
+    MAX_IDS_PER_REQUEST = 100
+
+    def __init__(self, api_access: ApiAccess, fetch_scheduler: FetchScheduler,
+                 character_cache: Optional[AsyncSingleFlightCache[CharacterKey, AnyCharacter]] = None,
+                 model_decoder: Optional[ModelDecoder] = None,
+                 max_ids_per_request: int = MAX_IDS_PER_REQUEST) -> None:
+        self.api_access = api_access
+        self.fetch_scheduler = fetch_scheduler
+        self.character_cache = character_cache if character_cache is not None else AsyncSingleFlightCache()
+        self.model_decoder = model_decoder or ModelDecoder()
+        self.max_ids_per_request = max_ids_per_request
+
+    @staticmethod
+    def character_id_from_url(url: str) -> int:
+        return int(url.rstrip('/').rsplit('/', 1)[-1])
+
+    @classmethod
+    def unique_ids(cls, character_urls: Iterable[str]) -> List[int]:
+        """Returns the character IDs behind the URLs, de-duplicated, in first-seen order."""
+        return list(dict.fromkeys(cls.character_id_from_url(url) for url in character_urls))
+
+    def chunk_ids(self, character_ids: List[int]) -> List[List[int]]:
+        size = self.max_ids_per_request
+        return [character_ids[i:i + size] for i in range(0, len(character_ids), size)]
+
+    @staticmethod
+    def build_url(character_ids: List[int]) -> str:
+        return f"{DataRep.rick_and_morty_base_url}character/{','.join(str(i) for i in character_ids)}"
+
+    def cache_key(self, character_id: int) -> CharacterKey:
+        return DataRep.rick_and_morty_base_url, self.model_decoder.character_type, character_id
+
+    async def fetch_by_ids_async(self, character_ids: List[int]) -> List[AnyCharacter]:
+        """Fetches the given IDs in as few requests as possible, keeping the requested order.
+
+        IDs already cached, or currently being fetched by another caller, are not requested again.
+        """
+        keys = [self.cache_key(character_id) for character_id in character_ids]
+        characters_by_key = await self.character_cache.get_or_load_many(keys, self._load_async)
+
+        return [characters_by_key[key] for key in keys if key in characters_by_key]
+
+    async def fetch_async(self, character_urls: Iterable[str]) -> List[AnyCharacter]:
+        return await self.fetch_by_ids_async(self.unique_ids(character_urls))
+
+    async def _load_async(self, keys: List[CharacterKey]) -> Dict[CharacterKey, AnyCharacter]:
+        base_url, character_type, _ = keys[0]
+        character_ids = [character_id for _, _, character_id in keys]
+        responses = await self.fetch_scheduler.run(self._fetch_chunk_async, self.chunk_ids(character_ids))
+
+        return {(base_url, character_type, character.id): character
+                for characters in responses for character in characters}
+
+    async def _fetch_chunk_async(self, character_ids: List[int]) -> List[AnyCharacter]:
+        with tracer.span('character_chunk', ids=len(character_ids)):
+            raw = await self.api_access.execute_get_request_raw_async(self.build_url(character_ids))
+
+            # The endpoint answers a single ID with an object rather than a list; the decoder accepts both
+            return self.model_decoder.characters(raw)
@@ -0,0 +1,90 @@
+import asyncio
+import csv
+import io
+import json
+import os
+import threading
+from typing import Callable, List, Optional, Sequence
+
+from Infrastructure.objects.data_classes.character import Character
+
+REPORT_FIELDS = ('id', 'name', 'location', 'status', 'species')
+
+
+def render_character_line(character: Character) -> str:
+    return (f"Character name is: {character.name}, Character ID is: {character.id}, "
+            f"Character location is: {character.location}, Character status is: {character.status}, "
+            f"Character species is: {character.species}.")
+
+
+class CharacterReportSink:
+    """Writes character reports as text, JSONL or CSV without blocking the event loop.
+
+    The whole report is rendered in memory first and written with a single buffered call on
+    a worker thread. Under pytest-xdist each worker gets its own file (name.gw0.txt, ...) so
+    parallel workers never clobber one another; append=True keeps earlier reports.
+    """
+
+    FORMATS = ('txt', 'jsonl', 'csv')
+
+    # Used when no filename is given; tests point it at a temporary file
+    default_filename = "characters_introduction.txt"
+
+    def __init__(self, filename: Optional[str] = None, output_format: Optional[str] = None,
+                 append: bool = False, per_worker: bool = True) -> None:
+        self.filename = filename or self.default_filename
+        self.output_format = output_format or os.path.splitext(self.filename)[1].lstrip('.') or 'txt'
+        self.append = append
+        self.per_worker = per_worker
+        self._lock = threading.Lock()
+
+        if self.output_format not in self.FORMATS:
+            raise ValueError(f"Unsupported report format '{self.output_format}', expected one of {self.FORMATS}")
+
+    @property
+    def path(self) -> str:
+        worker_id = os.getenv('PYTEST_XDIST_WORKER')
+        if not self.per_worker or not worker_id:
+            return self.filename
+
+        root, extension = os.path.splitext(self.filename)
+        return f"{root}.{worker_id}{extension}"
+
+    @staticmethod
+    def render_lines(characters: Sequence[Character]) -> List[str]:
+        return [render_character_line(character) for character in characters]
+
+    def write(self, characters: Sequence[Character], lines: Optional[List[str]] = None) -> None:
+        """Writes the report; pass lines already produced by render_lines to avoid rendering twice."""
+        self._write_text(self._render_report(characters, lines))
+
+    async def write_async(self, characters: Sequence[Character], lines: Optional[List[str]] = None) -> None:
+        await asyncio.to_thread(self._write_text, self._render_report(characters, lines))
+
+    @staticmethod
+    def _csv_text(write: Callable[[csv.DictWriter], None]) -> str:
+        buffer = io.StringIO()
+        write(csv.DictWriter(buffer, fieldnames=REPORT_FIELDS, lineterminator='\n'))
+        return buffer.getvalue()
+
+    def _render_report(self, characters: Sequence[Character], lines: Optional[List[str]]) -> str:
+        if self.output_format == 'txt':
+            lines = lines if lines is not None else self.render_lines(characters)
+            return ''.join(f"{line}\n" for line in lines)
+
+        rows = [{field: getattr(character, field) for field in REPORT_FIELDS} for character in characters]
+        if self.output_format == 'jsonl':
+            return ''.join(f"{json.dumps(row)}\n" for row in rows)
+
+        return self._csv_text(lambda writer: writer.writerows(rows))
+
+    def _write_text(self, text: str) -> None:
+        # The CSV header is decided under the lock, so overlapping appends never both write it
+        with self._lock:
+            if self.output_format == 'csv' and not self._has_content():
+                text = self._csv_text(csv.DictWriter.writeheader) + text
+            with open(self.path, 'a' if self.append else 'w', encoding='utf-8', newline='') as file:
+                file.write(text)
+
+    def _has_content(self) -> bool:
+        return self.append and os.path.exists(self.path) and os.path.getsize(self.path) > 0
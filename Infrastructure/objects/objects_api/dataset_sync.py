@@ -0,0 +1,231 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess, ApiRequestError
+from Infrastructure.Infra.dal.data_reposetory.data_rep import DataRep
+from Infrastructure.objects.data_classes.character import Character
+from Infrastructure.objects.data_classes.character_store import CharacterStore
+from Infrastructure.objects.data_classes.episode_response import Episode
+from Infrastructure.objects.data_classes.model_decoder import ModelDecoder
+from Infrastructure.objects.objects_api.character_batcher import CharacterBatcher
+from Infrastructure.objects.objects_api.episode_page_api import EpisodePageApi
+
+logger = logging.getLogger(__name__)
+
+
+class DatasetSnapshot:
+    """Local SQLite copy of the character and episode records, opened memory-mapped."""
+
+    RESOURCES = ('character', 'episode')
+
+    def __init__(self, path: str, mmap_size: int = 256 * 1024 * 1024) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(f'PRAGMA mmap_size={int(mmap_size)}')
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        for resource in self.RESOURCES:
+            self._connection.execute(
+                f'CREATE TABLE IF NOT EXISTS {resource} (id INTEGER PRIMARY KEY, created TEXT, body TEXT NOT NULL)'
+            )
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS sync_info (resource TEXT PRIMARY KEY, count INTEGER, synced_at REAL)'
+        )
+        self._connection.commit()
+
+    def count(self, resource: str) -> Optional[int]:
+        row = self._connection.execute('SELECT count FROM sync_info WHERE resource = ?', (resource,)).fetchone()
+        return row[0] if row else None
+
+    def bodies_by_id(self, resource: str) -> Dict[int, str]:
+        return dict(self._connection.execute(f'SELECT id, body FROM {self._table(resource)}'))
+
+    def upsert(self, resource: str, records: Iterable[Dict[str, Any]]) -> None:
+        self._connection.executemany(
+            f'INSERT OR REPLACE INTO {self._table(resource)} (id, created, body) VALUES (?, ?, ?)',
+            ((record['id'], record.get('created'), self.encode(record)) for record in records)
+        )
+
+    def delete(self, resource: str, ids: Iterable[int]) -> None:
+        self._connection.executemany(f'DELETE FROM {self._table(resource)} WHERE id = ?',
+                                     ((record_id,) for record_id in ids))
+
+    def mark_synced(self, resource: str, count: int) -> None:
+        self._connection.execute('INSERT OR REPLACE INTO sync_info (resource, count, synced_at) VALUES (?, ?, ?)',
+                                 (resource, count, time.time()))
+        self._connection.commit()
+
+    def records(self, resource: str) -> Iterable[Dict[str, Any]]:
+        for body, in self._connection.execute(f'SELECT body FROM {self._table(resource)} ORDER BY id'):
+            yield json.loads(body)
+
+    def load_characters(self, model_decoder: Optional[ModelDecoder] = None) -> List[Character]:
+        model_decoder = model_decoder or ModelDecoder(validate=False)
+        return [model_decoder.character(record) for record in self.records('character')]
+
+    def load_episodes(self, model_decoder: Optional[ModelDecoder] = None) -> List[Episode]:
+        model_decoder = model_decoder or ModelDecoder(validate=False)
+        return [model_decoder.episode(record) for record in self.records('episode')]
+
+    def load_character_store(self) -> CharacterStore:
+        return CharacterStore.from_characters(self.load_characters())
+
+    def close(self) -> None:
+        self._connection.close()
+
+    @staticmethod
+    def encode(record: Dict[str, Any]) -> str:
+        return json.dumps(record, separators=(',', ':'))
+
+    def _table(self, resource: str) -> str:
+        if resource not in self.RESOURCES:
+            raise ValueError(f"Unknown resource: {resource}")
+        return resource
+
+
+class DatasetSync:
+    """Brings a DatasetSnapshot up to date while fetching as little as possible.
+
+    Records carry no update stamp, so a record counts as changed when its body differs from
+    the snapshot. The first page of each resource is always read; when info.count matches
+    the snapshot and none of its records changed, nothing else is requested. Episodes are
+    synced first, and the characters of every new or changed episode are re-fetched through
+    the multi-ID endpoint, since their episode lists changed with it. New records are looked
+    for right above the highest known ID; if the row count still disagrees with info.count
+    (records removed upstream, or IDs with gaps), the resource is crawled in full and every
+    ID the API no longer returns is deleted.
+    """
+
+    def __init__(self, snapshot: DatasetSnapshot, episode_page_api: Optional[EpisodePageApi] = None) -> None:
+        self.snapshot = snapshot
+        self.episode_page_api = episode_page_api or EpisodePageApi()
+
+    async def sync_async(self) -> Dict[str, int]:
+        """Syncs every resource and returns how many records were fetched for each."""
+        fetched_episodes, changed_episodes = await self._sync_async('episode')
+        fetched_characters, _ = await self._sync_async('character', self._cast_ids(changed_episodes))
+
+        return {'character': fetched_characters, 'episode': fetched_episodes}
+
+    async def sync_resource_async(self, resource: str, refresh_ids: Iterable[int] = ()) -> int:
+        """Syncs one resource, re-fetching refresh_ids as well, and returns how many records were fetched."""
+        fetched, _ = await self._sync_async(resource, refresh_ids)
+        return fetched
+
+    async def _sync_async(self, resource: str, refresh_ids: Iterable[int] = ()
+                          ) -> Tuple[int, List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]]:
+        api_access = self.episode_page_api.api_access
+        first_page = await api_access.execute_get_request_async(f"{DataRep.rick_and_morty_base_url}{resource}")
+        count = first_page['info']['count']
+        stored = self.snapshot.bodies_by_id(resource)
+        changes: List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]] = []
+
+        self._merge(resource, first_page['results'], stored, changes)
+        fetched = len(first_page['results'])
+
+        refresh = set(refresh_ids) - {record['id'] for record in first_page['results']}
+        wanted = set(refresh)
+        if len(stored) < count:
+            # New records normally take the next IDs; the count check below catches when they did not
+            highest_id = max(stored, default=0)
+            wanted.update(range(highest_id + 1, highest_id + 1 + count - len(stored)))
+
+        if wanted:
+            records = await self._fetch_by_ids_async(resource, sorted(wanted))
+            self._merge(resource, records, stored, changes)
+            fetched += len(records)
+            self._delete(resource, refresh - {record['id'] for record in records}, stored)
+
+        if len(stored) != count:
+            logger.info(f"{resource}: snapshot has {len(stored)} records but the API {count}, crawling everything")
+            fetched += await self._crawl_async(resource, stored, changes)
+
+        self.snapshot.mark_synced(resource, count)
+        logger.info(f"{resource}: {count} records, {len(changes)} new or changed")
+
+        return fetched, changes
+
+    async def _crawl_async(self, resource: str, stored: Dict[int, str],
+                           changes: List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]) -> int:
+        fetched = 0
+        returned: Set[int] = set()
+        async for page in self.episode_page_api.universe_crawler.iter_pages_async(resource):
+            self._merge(resource, page['results'], stored, changes)
+            fetched += len(page['results'])
+            returned.update(record['id'] for record in page['results'])
+
+        self._delete(resource, set(stored) - returned, stored)
+
+        return fetched
+
+    def _merge(self, resource: str, records: List[Dict[str, Any]], stored: Dict[int, str],
+               changes: List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]) -> None:
+        for record in records:
+            body = DatasetSnapshot.encode(record)
+            previous = stored.get(record['id'])
+            if previous != body:
+                changes.append((json.loads(previous) if previous is not None else None, record))
+                stored[record['id']] = body
+        self.snapshot.upsert(resource, records)
+
+    def _delete(self, resource: str, ids: Set[int], stored: Dict[int, str]) -> None:
+        ids = {record_id for record_id in ids if record_id in stored}
+        if ids:
+            logger.info(f"{resource}: {len(ids)} records no longer exist upstream, deleting them")
+            self.snapshot.delete(resource, ids)
+            for record_id in ids:
+                del stored[record_id]
+
+    async def _fetch_by_ids_async(self, resource: str, ids: List[int]) -> List[Dict[str, Any]]:
+        batcher = self.episode_page_api.character_batcher
+        urls = [f"{DataRep.rick_and_morty_base_url}{resource}/{','.join(map(str, chunk))}"
+                for chunk in batcher.chunk_ids(ids)]
+        responses = await self.episode_page_api.fetch_scheduler.run(self._get_existing_async, urls)
+
+        return [record for response in responses for record in (response if isinstance(response, list) else [response])]
+
+    async def _get_existing_async(self, url: str) -> Any:
+        # A lookup of one ID that does not exist (any more) answers 404 instead of an empty list
+        try:
+            return await self.episode_page_api.scheduled_api_access.execute_get_request_async(url)
+        except ApiRequestError as e:
+            if e.status == 404:
+                return []
+            raise
+
+    @staticmethod
+    def _cast_ids(changes: List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]) -> Set[int]:
+        # Characters leaving an episode changed as much as those joining it
+        character_ids: Set[int] = set()
+        for previous, record in changes:
+            for episode in (previous, record):
+                if episode is not None:
+                    character_ids.update(CharacterBatcher.unique_ids(episode.get('characters', [])))
+        return character_ids
+
+
+async def _main_async(snapshot_path: str) -> None:
+    snapshot = DatasetSnapshot(snapshot_path)
+    try:
+        fetched = await DatasetSync(snapshot).sync_async()
+        print(f"Snapshot {snapshot_path} is up to date, fetched: {fetched}")
+    finally:
+        snapshot.close()
+        await ApiAccess.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Incrementally sync the Rick and Morty dataset to a local snapshot.")
+    parser.add_argument('--snapshot', default=os.getenv('DATASET_SNAPSHOT_PATH', 'test-results/dataset.sqlite'))
+    parser.add_argument('--base-url', default=DataRep.rick_and_morty_base_url)
+    arguments = parser.parse_args()
+
+    DataRep.rick_and_morty_base_url = arguments.base_url
+    asyncio.run(_main_async(arguments.snapshot))
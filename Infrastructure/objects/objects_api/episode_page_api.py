@@ -1,73 +1,142 @@
 import asyncio
+import logging
 import random
-from typing import List
+from itertools import islice
+from typing import AsyncIterator, Dict, Iterator, List, Optional
 
-from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess
+from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess, ApiRequestError, CircuitOpenError
+from Infrastructure.Infra.dal.api_access.fetch_scheduler import FetchScheduler
 from Infrastructure.Infra.dal.data_reposetory.data_rep import DataRep
+from Infrastructure.Infra.utils.async_cache import AsyncSingleFlightCache
+from Infrastructure.Infra.utils.tracing import tracer
 from Infrastructure.objects.data_classes.character import Character
-from Infrastructure.objects.data_classes.episode_response import EpisodeResponse, Episode
+from Infrastructure.objects.data_classes.character_store import CharacterStore
+from Infrastructure.objects.data_classes.episode_response import EpisodeResponse
+from Infrastructure.objects.data_classes.model_decoder import AnyCharacter, ModelDecoder
+from Infrastructure.objects.objects_api.character_batcher import CharacterBatcher, CharacterKey
+from Infrastructure.objects.objects_api.character_report_sink import CharacterReportSink
+from Infrastructure.objects.objects_api.lazy_character_resolver import LazyCharacter, LazyCharacterResolver
+from Infrastructure.objects.objects_api.universe_crawler import UniverseCrawler
 
+logger = logging.getLogger(__name__)
 
-class EpisodePageApi:
 
-    def __init__(self) -> None:
+class EpisodePageApi:
+    # Shared by every instance so overlapping episodes and parallel tests reuse lookups; keyed by
+    # base URL and decoded type as well as ID (see CharacterBatcher.cache_key)
+    character_cache: AsyncSingleFlightCache[CharacterKey, AnyCharacter] = AsyncSingleFlightCache(max_size=2048)
+    # Seed for the sampling RNG of new instances. Without one, runs against a cassette still use
+    # CASSETTE_RANDOM_SEED so the sampled multi-ID URL is the same when recording and replaying
+    random_seed: Optional[int] = None
+    CASSETTE_RANDOM_SEED = 0
+
+    def __init__(self, fetch_scheduler: Optional[FetchScheduler] = None,
+                 model_decoder: Optional[ModelDecoder] = None,
+                 report_sink: Optional[CharacterReportSink] = None,
+                 rng: Optional[random.Random] = None) -> None:
         self.api_access = ApiAccess()
+        # Requests made under the fetch scheduler leave HTTP status retries to it, so a 429 or
+        # 5xx is retried once per scheduler attempt and reaches its concurrency cap right away
+        self.scheduled_api_access = ApiAccess(retry_http_statuses=False)
+        self.fetch_scheduler = fetch_scheduler or FetchScheduler()
+        self.model_decoder = model_decoder or ModelDecoder()
+        self.report_sink = report_sink or CharacterReportSink()
+        self.rng = rng or random.Random(self._random_seed())
+        self.character_batcher = CharacterBatcher(self.scheduled_api_access, self.fetch_scheduler,
+                                                  self.character_cache, self.model_decoder)
+        self.universe_crawler = UniverseCrawler(self.scheduled_api_access, self.fetch_scheduler, self.model_decoder)
+        self.character_resolver = LazyCharacterResolver(self.character_batcher)
+
+    def _random_seed(self) -> Optional[int]:
+        if self.random_seed is None and self.api_access.cassette is not None:
+            return self.CASSETTE_RANDOM_SEED
+        return self.random_seed
 
     async def get_all_episodes(self, url: str) -> EpisodeResponse:
-        data = await self.api_access.execute_get_request_async(url)
-        episodes = [Episode(**episode) for episode in data['results']]
-
-        return EpisodeResponse(results=episodes, info=data['info'])
+        raw = await self.api_access.execute_get_request_raw_async(url)
+        return self.model_decoder.episode_response(raw)
 
     async def fetch_character_details(self, url: str) -> Character:
-        character_data = await self.api_access.execute_get_request_async(url)
-
-        character = Character(
-            id=character_data['id'],
-            name=character_data['name'],
-            status=character_data.get('status', 'unknown'),
-            species=character_data.get('species', 'unknown'),
-            location=character_data['location']['name'] if 'location' in character_data else None,
-            gender=character_data.get('gender', 'unknown'),
-            origin=character_data.get('origin', 'unknown'),
-            image=character_data.get('image', 'unknown'),
-            episode=character_data.get('episode', []),
-            url=character_data.get('url', 'unknown'),
-            created=character_data.get('created', 'unknown')
-        )
-        return character
+        """Fetches one character; run it under self.fetch_scheduler, which retries 429/5xx for it."""
+        async def load() -> Character:
+            raw = await self.scheduled_api_access.execute_get_request_raw_async(url)
+            return self.model_decoder.character(self.model_decoder.loads(raw))
+
+        return await self.character_cache.get_or_load(
+            self.character_batcher.cache_key(CharacterBatcher.character_id_from_url(url)), load)
 
     async def fetch_all_characters_async(self, selected_character_urls: List[str]) -> List[Character]:
-        tasks = [self.fetch_character_details(url) for url in selected_character_urls]
-        return await asyncio.gather(*tasks)
+        """Fetches each distinct character once, batched through the multi-ID endpoint."""
+        return await self.character_batcher.fetch_async(selected_character_urls)
+
+    def reference_characters(self, character_urls: List[str]) -> List[LazyCharacter]:
+        """Returns lazy references that fetch, in batches, only when a field beyond id/url is read."""
+        return self.character_resolver.references(character_urls)
+
+    async def get_character_references_async(self, episode_urls: List[str]) -> List[LazyCharacter]:
+        return self.reference_characters(await self.get_selected_character_urls_async(episode_urls))
 
     @staticmethod
     def select_random_characters(characters: List[Character], num: int = 2) -> List[Character]:
         return random.sample(characters, num)
 
+    async def sample_characters_async(self, character_urls: List[str], num: int = 2,
+                                      max_fallback_rounds: int = 3) -> List[Character]:
+        """Picks num distinct characters at random from the URLs and fetches only those.
+
+        IDs are drawn from self.rng, which is seeded from random_seed, or from CASSETTE_RANDOM_SEED
+        while a cassette is in use, so the picks repeat from run to run. When a pick cannot be
+        fetched, a replacement is drawn lazily from the remaining IDs, for at most
+        max_fallback_rounds extra requests.
+        """
+        character_ids = CharacterBatcher.unique_ids(character_urls)
+        if num > len(character_ids):
+            raise ValueError(f"Cannot sample {num} characters from {len(character_ids)} distinct ones")
+
+        draws = self._draw_without_replacement(character_ids)
+        selected: List[Character] = []
+        rounds = 0
+
+        while len(selected) < num:
+            wanted = list(islice(draws, num - len(selected)))
+            if not wanted or rounds > max_fallback_rounds:
+                raise LookupError(f"Only {len(selected)} of {num} sampled characters could be fetched")
+            rounds += 1
+
+            try:
+                fetched = await self.character_batcher.fetch_by_ids_async(wanted)
+            except CircuitOpenError:
+                raise
+            except ApiRequestError as e:
+                logger.warning(f"Sampled characters {wanted} could not be fetched ({e}), drawing replacements")
+                continue
+
+            selected.extend(fetched)
+            if len(fetched) < len(wanted):
+                logger.warning(f"{len(wanted) - len(fetched)} sampled characters do not exist, drawing replacements")
+
+        return selected
+
+    def _draw_without_replacement(self, population: List[int]) -> Iterator[int]:
+        # Lazy Fisher-Yates: each draw costs O(1), and only as many as needed are made
+        pool = list(population)
+        for i in range(len(pool)):
+            j = self.rng.randrange(i, len(pool))
+            pool[i], pool[j] = pool[j], pool[i]
+            yield pool[i]
+
     @staticmethod
     def get_character_details(characters: List[Character]) -> List[str]:
-        return [
-            f"Character name is: {character.name}, Character ID is: {character.id}, "
-            f"Character location is: {character.location}, Character status is: {character.status}, "
-            f"Character species is: {character.species}."
-            for character in characters
-        ]
+        return CharacterReportSink.render_lines(characters)
 
     @staticmethod
     def write_character_details_to_file(characters: List[Character], filename: str = "characters_introduction.txt") -> None:
-        with open(filename, "w") as file:
-            for character in characters:
-                file.write(f"Character name is: {character.name}, Character ID is: {character.id}, "
-                           f"Character location is: {character.location}, Character status is: {character.status}, "
-                           f"Character species is: {character.species}.\n")
+        CharacterReportSink(filename).write(characters)
 
     @staticmethod
-    def print_character_details(characters: List[Character]) -> None:
-        for character in characters:
-            print(f"Character name is: {character.name}, Character ID is: {character.id}, "
-                  f"Character location is: {character.location}, Character status is: {character.status}, "
-                  f"Character species is: {character.species}.")
+    def print_character_details(characters: List[Character], lines: Optional[List[str]] = None) -> None:
+        for line in lines if lines is not None else CharacterReportSink.render_lines(characters):
+            print(line)
 
     async def get_episode_urls_async(self) -> List[str]:
         episode_url = f"{DataRep.rick_and_morty_base_url}episode"
@@ -76,22 +145,79 @@ class EpisodePageApi:
 
         return episode_urls
 
+    async def get_all_episode_urls_async(self) -> List[str]:
+        return [episode.url async for episode in self.universe_crawler.iter_episodes_async()]
+
+    async def load_character_store_async(self) -> CharacterStore:
+        """Crawls every character page into an indexed CharacterStore."""
+        store = CharacterStore()
+        async for character in self.universe_crawler.iter_characters_async():
+            store.add(character)
+
+        return store
+
     async def get_selected_character_urls_async(self, episode_urls: List[str]) -> List[str]:
+        episodes_data = await self.fetch_scheduler.run(self.scheduled_api_access.execute_get_request_async,
+                                                       episode_urls)
         selected_character_urls = []
-        for episode_url in episode_urls:
-            episode_data = await self.api_access.execute_get_request_async(episode_url)
-            character_urls = episode_data.get('characters', [])
-            selected_character_urls.extend(character_urls)
+        for episode_data in episodes_data:
+            selected_character_urls.extend(episode_data.get('characters', []))
 
         return selected_character_urls
 
+    async def stream_character_urls_async(self, episode_urls: List[str]) -> AsyncIterator[List[str]]:
+        """Yields each episode's character URLs as soon as it arrives, fetching all episodes concurrently."""
+        tasks = [asyncio.ensure_future(self.fetch_scheduler.submit(self.scheduled_api_access.execute_get_request_async,
+                                                                   url))
+                 for url in episode_urls]
+        try:
+            for arrival in asyncio.as_completed(tasks):
+                episode_data = await arrival
+                yield episode_data.get('characters', [])
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def fetch_characters_from_episodes_async(self, episode_urls: List[str]) -> List[Character]:
+        """Resolves episodes concurrently and fetches each one's new characters while the rest are in flight.
+
+        Batches follow the order episodes arrive in and their IDs are sorted, so the same arrival
+        order always gives the same request URLs. The characters are returned in ID order.
+        """
+        seen_ids: Dict[int, None] = {}
+        fetches = []
+
+        try:
+            async for character_urls in self.stream_character_urls_async(episode_urls):
+                new_ids = sorted(i for i in CharacterBatcher.unique_ids(character_urls) if i not in seen_ids)
+                seen_ids.update(dict.fromkeys(new_ids))
+                if new_ids:
+                    fetches.append(asyncio.ensure_future(self.character_batcher.fetch_by_ids_async(new_ids)))
+
+            batches = await asyncio.gather(*fetches)
+        except BaseException:
+            for fetch in fetches:
+                fetch.cancel()
+            raise
+
+        return sorted((character for batch in batches for character in batch), key=lambda character: character.id)
+
     async def randomly_choose_two_characters_pipe_async(self) -> List[Character]:
-        episode_urls = await self.get_episode_urls_async()
-        selected_character_urls = await self.get_selected_character_urls_async(episode_urls)
-        characters = await self.fetch_all_characters_async(selected_character_urls)
-        selected_characters = self.select_random_characters(characters)
-        self.print_character_details(selected_characters)
-        self.write_character_details_to_file(selected_characters)
+        with tracer.span('randomly_choose_two_characters_pipe'):
+            with tracer.span('episodes'):
+                episode_urls = await self.get_episode_urls_async()
+
+            with tracer.span('character_urls', episodes=len(episode_urls)) as span:
+                character_urls = await self.get_selected_character_urls_async(episode_urls)
+                span['characters'] = len(character_urls)
+
+            with tracer.span('sample_characters'):
+                selected_characters = await self.sample_characters_async(character_urls)
+
+            with tracer.span('print_write'):
+                character_details = self.get_character_details(selected_characters)
+                self.print_character_details(selected_characters, character_details)
+                await self.report_sink.write_async(selected_characters, character_details)
 
         return selected_characters
 
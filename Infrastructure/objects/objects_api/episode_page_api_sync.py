@@ -0,0 +1,61 @@
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
+
+from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess
+from Infrastructure.Infra.utils.background_loop import BackgroundEventLoop
+from Infrastructure.objects.data_classes.character import Character
+from Infrastructure.objects.data_classes.character_store import CharacterStore
+from Infrastructure.objects.data_classes.episode_response import EpisodeResponse
+from Infrastructure.objects.objects_api.episode_page_api import EpisodePageApi
+
+R = TypeVar('R')
+
+
+class EpisodePageApiSync:
+    """Blocking facade over EpisodePageApi for synchronous Selenium tests.
+
+    Every call runs on one background event-loop thread, so the pooled aiohttp session and
+    caches are reused across calls. The *_future methods return immediately with a
+    concurrent.futures.Future, letting a test start a fetch, drive the browser, and only
+    then wait for the data.
+    """
+
+    def __init__(self, episode_page_api: Optional[EpisodePageApi] = None,
+                 background_loop: Optional[BackgroundEventLoop] = None) -> None:
+        self.episode_page_api = episode_page_api or EpisodePageApi()
+        self.background_loop = background_loop or BackgroundEventLoop(name='episode-page-api')
+        # Lazy references resolve on this loop too, instead of driving the API from a second one
+        self.episode_page_api.character_resolver.background_loop = self.background_loop
+
+    def __enter__(self) -> 'EpisodePageApiSync':
+        self.background_loop.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def submit(self, func: Callable[..., Awaitable[R]], *args: Any) -> 'Future[R]':
+        """Schedules func(*args) on the background loop and returns its Future."""
+        return self.background_loop.submit(func(*args))
+
+    def randomly_choose_two_characters_pipe(self) -> List[Character]:
+        return self.background_loop.call(self.episode_page_api.randomly_choose_two_characters_pipe_async)
+
+    def randomly_choose_two_characters_pipe_future(self) -> 'Future[List[Character]]':
+        return self.submit(self.episode_page_api.randomly_choose_two_characters_pipe_async)
+
+    def get_all_episodes(self, url: str) -> EpisodeResponse:
+        return self.background_loop.call(self.episode_page_api.get_all_episodes, url)
+
+    def get_all_episode_urls(self) -> List[str]:
+        return self.background_loop.call(self.episode_page_api.get_all_episode_urls_async)
+
+    def fetch_all_characters(self, character_urls: List[str]) -> List[Character]:
+        return self.background_loop.call(self.episode_page_api.fetch_all_characters_async, character_urls)
+
+    def load_character_store(self) -> CharacterStore:
+        return self.background_loop.call(self.episode_page_api.load_character_store_async)
+
+    def close(self) -> None:
+        """Closes the background loop's API session and stops the loop thread."""
+        self.background_loop.stop(cleanup=ApiAccess.close)
@@ -0,0 +1,123 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from Infrastructure.Infra.dal.data_reposetory.data_rep import DataRep
+from Infrastructure.Infra.utils.background_loop import BackgroundEventLoop
+from Infrastructure.objects.data_classes.character import Character
+from Infrastructure.objects.objects_api.character_batcher import CharacterBatcher
+
+
+class LazyCharacter:
+    """Reference to a character that fetches its details on first use.
+
+    id and url are known up front. Reading any other Character field loads the record,
+    together with every other reference of the same resolver still waiting to load, in one
+    multi-ID request. In async code call await load() first, attribute access from a running
+    event loop would block it.
+    """
+
+    __slots__ = ('id', '_resolver', '_character')
+
+    def __init__(self, character_id: int, resolver: 'LazyCharacterResolver') -> None:
+        self.id = character_id
+        self._resolver = resolver
+        self._character: Optional[Character] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_') or name not in Character.__dataclass_fields__:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        if self._character is not None:
+            return f"LazyCharacter(id={self.id}, name={self._character.name!r})"
+        return f"LazyCharacter(id={self.id}, loaded=False)"
+
+    @property
+    def url(self) -> str:
+        if self._character is not None:
+            return self._character.url
+        return f"{DataRep.rick_and_morty_base_url}character/{self.id}"
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._character is not None
+
+    def resolve(self) -> Character:
+        """Returns the full Character, loading it (and its pending siblings) if needed."""
+        if self._character is None:
+            self._resolver.resolve([self])
+        return self._character
+
+    async def load(self) -> Character:
+        if self._character is None:
+            await self._resolver.resolve_async([self])
+        return self._character
+
+
+class LazyCharacterResolver:
+    """Creates LazyCharacter references and loads them in batches.
+
+    Whenever one reference needs its details, every pending reference of this resolver
+    (up to max_batch) is loaded with it through the CharacterBatcher, whose single-flight
+    cache also coalesces IDs that other callers are already fetching. Synchronous access
+    runs the fetch on the loop of the EpisodePageApiSync wrapping the API, if any, or else
+    on a shared background event loop.
+    """
+
+    background_loop = BackgroundEventLoop(name='lazy-character-resolver')
+
+    def __init__(self, character_batcher: CharacterBatcher, max_batch: int = CharacterBatcher.MAX_IDS_PER_REQUEST,
+                 background_loop: Optional[BackgroundEventLoop] = None) -> None:
+        self.character_batcher = character_batcher
+        self.max_batch = max_batch
+        if background_loop is not None:
+            self.background_loop = background_loop
+        self._pending: Dict[int, List[LazyCharacter]] = {}
+        self._lock = threading.Lock()
+
+    def reference(self, url_or_id: Union[str, int]) -> LazyCharacter:
+        character_id = url_or_id if isinstance(url_or_id, int) else CharacterBatcher.character_id_from_url(url_or_id)
+        reference = LazyCharacter(character_id, self)
+
+        with self._lock:
+            self._pending.setdefault(character_id, []).append(reference)
+
+        return reference
+
+    def references(self, urls_or_ids: Iterable[Union[str, int]]) -> List[LazyCharacter]:
+        return [self.reference(url_or_id) for url_or_id in urls_or_ids]
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def resolve(self, references: List[LazyCharacter]) -> None:
+        self.background_loop.run(self.resolve_async(references))
+
+    async def resolve_async(self, references: List[LazyCharacter]) -> None:
+        """Loads the given references plus pending siblings, up to max_batch IDs in total."""
+        wanted = [reference.id for reference in references if not reference.is_loaded]
+        with self._lock:
+            siblings = [character_id for character_id in self._pending if character_id not in wanted]
+            character_ids = list(dict.fromkeys(wanted + siblings[:max(0, self.max_batch - len(wanted))]))
+            waiting = {character_id: self._pending.pop(character_id, []) for character_id in character_ids}
+
+        try:
+            characters = await self.character_batcher.fetch_by_ids_async(character_ids)
+        except BaseException:
+            with self._lock:
+                for character_id, pending in waiting.items():
+                    self._pending.setdefault(character_id, []).extend(pending)
+            raise
+
+        by_id = {character.id: character for character in characters}
+        for character_id, pending in waiting.items():
+            for reference in pending:
+                reference._character = by_id.get(character_id)
+
+        for reference in references:
+            if reference._character is None:
+                reference._character = by_id.get(reference.id)
+            if reference._character is None:
+                raise LookupError(f"Character {reference.id} does not exist")
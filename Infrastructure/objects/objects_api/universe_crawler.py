@@ -0,0 +1,67 @@
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess
+from Infrastructure.Infra.dal.api_access.fetch_scheduler import FetchScheduler
+from Infrastructure.Infra.dal.data_reposetory.data_rep import DataRep
+from Infrastructure.objects.data_classes.character import Character
+from Infrastructure.objects.data_classes.episode_response import Episode, EpisodeResponse
+from Infrastructure.objects.data_classes.model_decoder import ModelDecoder
+
+
+class UniverseCrawler:
+    """Streams every episode or character of the API, page by page.
+
+    Once the first page reveals info.pages, up to prefetch_pages further pages are kept
+    in flight while earlier ones are consumed, so memory stays bounded by the window.
+    """
+
+    def __init__(self, api_access: ApiAccess, fetch_scheduler: FetchScheduler,
+                 model_decoder: Optional[ModelDecoder] = None, prefetch_pages: int = 4) -> None:
+        self.api_access = api_access
+        self.fetch_scheduler = fetch_scheduler
+        self.model_decoder = model_decoder or ModelDecoder()
+        self.prefetch_pages = prefetch_pages
+
+    async def iter_pages_async(self, resource: str) -> AsyncIterator[Dict[str, Any]]:
+        resource_url = f"{DataRep.rick_and_morty_base_url}{resource}"
+        page = await self._get_page_async(resource_url)
+        yield page
+
+        pages = page['info'].get('pages')
+        if pages is None:
+            # Page count unknown, fall back to walking info.next one page at a time
+            while page['info'].get('next'):
+                page = await self._get_page_async(page['info']['next'])
+                yield page
+            return
+
+        pending: Deque[asyncio.Future] = deque()
+        next_page = 2
+        try:
+            while next_page <= pages or pending:
+                while next_page <= pages and len(pending) < self.prefetch_pages:
+                    pending.append(asyncio.ensure_future(self._get_page_async(f"{resource_url}?page={next_page}")))
+                    next_page += 1
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def iter_episode_pages_async(self) -> AsyncIterator[EpisodeResponse]:
+        async for page in self.iter_pages_async('episode'):
+            yield self.model_decoder.episode_page(page)
+
+    async def iter_episodes_async(self) -> AsyncIterator[Episode]:
+        async for episode_response in self.iter_episode_pages_async():
+            for episode in episode_response.results:
+                yield episode
+
+    async def iter_characters_async(self) -> AsyncIterator[Character]:
+        async for page in self.iter_pages_async('character'):
+            for character_data in page['results']:
+                yield self.model_decoder.character(character_data)
+
+    async def _get_page_async(self, url: str) -> Dict[str, Any]:
+        return await self.fetch_scheduler.submit(self.api_access.execute_get_request_async, url)
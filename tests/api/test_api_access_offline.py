@@ -0,0 +1,170 @@
+import asyncio
+from urllib.parse import urlsplit
+
+import pytest
+
+from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess, ApiRequestError, CircuitOpenError
+from Infrastructure.Infra.dal.api_access.cassette import Cassette, CassetteMismatchError
+from Infrastructure.Infra.dal.api_access.rate_limiter import SharedTokenBucket
+from Infrastructure.Infra.dal.api_access.resilience import CircuitBreaker, RetryPolicy, TimeoutSettings
+from Infrastructure.Infra.dal.api_access.response_cache import ResponseCache
+from Infrastructure.Infra.dal.data_reposetory.data_rep import DataRep
+from Infrastructure.Infra.dal.fake_api.fake_rick_and_morty_server import FakeServerSettings
+
+
+@pytest.mark.asyncio
+class TestApiAccessOffline:
+    """ApiAccess layers against the local fake Rick and Morty API."""
+
+    async def test_cassette_replays_recorded_traffic_without_network(self, fake_api, tmp_path):
+        cassette_path = str(tmp_path / 'episodes.json.gz')
+        episode_url = f"{DataRep.rick_and_morty_base_url}episode/1"
+
+        recorder = Cassette(cassette_path, mode=Cassette.RECORD)
+        recorded = await ApiAccess(cassette=recorder).execute_get_request_async(episode_url)
+        recorder.save()
+
+        fake_api.reset(FakeServerSettings(error_rate=1.0))
+        replayed = await ApiAccess(cassette=Cassette(cassette_path)).execute_get_request_async(episode_url)
+
+        assert replayed == recorded
+        assert fake_api.request_count == 0
+
+    async def test_strict_cassette_rejects_unrecorded_request(self, fake_api, tmp_path):
+        cassette_path = str(tmp_path / 'empty.json.gz')
+        Cassette(cassette_path, mode=Cassette.RECORD).save()
+
+        with pytest.raises(CassetteMismatchError):
+            await ApiAccess(cassette=Cassette(cassette_path)).execute_get_request_async(
+                f"{DataRep.rick_and_morty_base_url}episode/1")
+
+    async def test_fresh_cache_entry_is_served_without_a_request(self, fake_api, tmp_path):
+        response_cache = ResponseCache(str(tmp_path / 'responses.sqlite'))
+        api_access = ApiAccess(response_cache=response_cache)
+        episode_url = f"{DataRep.rick_and_morty_base_url}episode/1"
+
+        first = await api_access.execute_get_request_async(episode_url)
+        second = await api_access.execute_get_request_async(episode_url)
+        response_cache.close()
+
+        assert second == first
+        assert fake_api.request_count == 1
+
+    async def test_stale_cache_entry_is_revalidated_with_its_etag(self, fake_api, tmp_path):
+        response_cache = ResponseCache(str(tmp_path / 'responses.sqlite'), ttl=0)
+        api_access = ApiAccess(response_cache=response_cache)
+        episode_url = f"{DataRep.rick_and_morty_base_url}episode/1"
+        await api_access.execute_get_request_async(episode_url)
+
+        # Swap the cached body while keeping the ETag: only a 304 answer can hand it back
+        cached = await response_cache.get_async(episode_url)
+        await response_cache.put_async(episode_url, b'{"id": 1, "revalidated": true}', cached.etag)
+        revalidated = await api_access.execute_get_request_async(episode_url)
+        response_cache.close()
+
+        assert revalidated == {'id': 1, 'revalidated': True}
+        assert fake_api.request_count == 2
+
+    async def test_cache_evicts_least_recently_used_past_max_bytes(self, tmp_path):
+        response_cache = ResponseCache(str(tmp_path / 'responses.sqlite'), max_bytes=250)
+
+        await response_cache.put_async('first', b'1' * 100)
+        await response_cache.put_async('second', b'2' * 100)
+        await response_cache.get_async('first')
+        await response_cache.put_async('third', b'3' * 100)
+
+        assert await response_cache.get_async('second') is None
+        assert (await response_cache.get_async('first')).body == b'1' * 100
+        assert (await response_cache.get_async('third')).body == b'3' * 100
+        response_cache.close()
+
+    async def test_transient_server_errors_are_retried(self, fake_api):
+        fake_api.reset(FakeServerSettings(error_rate=0.5, seed=3))
+        api_access = ApiAccess(retry_policy=RetryPolicy(max_attempts=10, base_backoff=0.01),
+                               circuit_breaker=CircuitBreaker(failure_threshold=100))
+        retries_before = ApiAccess.resilience_stats.retries
+
+        episodes = [await api_access.execute_get_request_async(f"{DataRep.rick_and_morty_base_url}episode/{i}")
+                    for i in range(1, 11)]
+
+        assert [episode['id'] for episode in episodes] == list(range(1, 11))
+        assert ApiAccess.resilience_stats.retries > retries_before
+
+    async def test_slow_response_times_out(self, fake_api):
+        fake_api.reset(FakeServerSettings(latency=1.0))
+        api_access = ApiAccess(retry_policy=RetryPolicy(max_attempts=2, base_backoff=0.01),
+                               timeout_settings=TimeoutSettings(request=0.1, total=5))
+
+        with pytest.raises(asyncio.TimeoutError):
+            await api_access.execute_get_request_async(f"{DataRep.rick_and_morty_base_url}episode/1")
+
+        assert fake_api.request_count == 2
+
+    async def test_open_circuit_fails_fast(self, fake_api):
+        fake_api.reset(FakeServerSettings(error_rate=1.0))
+        api_access = ApiAccess(retry_policy=RetryPolicy(max_attempts=2, base_backoff=0.01),
+                               circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+        episode_url = f"{DataRep.rick_and_morty_base_url}episode/1"
+
+        with pytest.raises(ApiRequestError) as error:
+            await api_access.execute_get_request_async(episode_url)
+        assert error.value.status == 500
+
+        with pytest.raises(CircuitOpenError):
+            await api_access.execute_get_request_async(episode_url)
+        assert fake_api.request_count == 2
+
+    async def test_fresh_cache_entry_is_served_while_the_circuit_is_open(self, fake_api, tmp_path):
+        response_cache = ResponseCache(str(tmp_path / 'responses.sqlite'))
+        circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        api_access = ApiAccess(response_cache=response_cache, circuit_breaker=circuit_breaker)
+        episode_url = f"{DataRep.rick_and_morty_base_url}episode/1"
+        cached = await api_access.execute_get_request_async(episode_url)
+
+        circuit_breaker.record_failure(urlsplit(episode_url).netloc)
+        attempts_before = ApiAccess.resilience_stats.attempts
+        served = await api_access.execute_get_request_async(episode_url)
+        with pytest.raises(CircuitOpenError):
+            await api_access.execute_get_request_async(f"{DataRep.rick_and_morty_base_url}episode/2")
+        response_cache.close()
+
+        assert served == cached
+        assert ApiAccess.resilience_stats.attempts == attempts_before
+        assert fake_api.request_count == 1
+
+    async def test_workers_share_one_token_bucket(self, tmp_path):
+        bucket_path = str(tmp_path / 'api.bucket')
+        workers = [SharedTokenBucket(bucket_path, rate=50), SharedTokenBucket(bucket_path, rate=50)]
+
+        delays = sorted(worker.reserve() for _ in range(10) for worker in workers)
+
+        assert delays[0] == 0
+        assert delays[-1] == pytest.approx(19 / 50, abs=0.05)
+
+    async def test_rate_limiter_keeps_requests_under_quota(self, fake_api, tmp_path):
+        fake_api.reset(FakeServerSettings(rate_limit=50, rate_limit_burst=5))
+        api_access = ApiAccess(retry_policy=RetryPolicy(max_attempts=1),
+                               rate_limiter=SharedTokenBucket(str(tmp_path / 'api.bucket'), rate=30, capacity=2))
+
+        episodes = await asyncio.gather(*(api_access.execute_get_request_async(
+            f"{DataRep.rick_and_morty_base_url}episode/{i}") for i in range(1, 31)))
+
+        assert [episode['id'] for episode in episodes] == list(range(1, 31))
+        assert fake_api.request_count == 30
+
+    async def test_http_metrics_time_each_request_phase(self, fake_api):
+        fake_api.reset(FakeServerSettings(latency=0.02))
+        # The session-wide aiohttp session reports to the metrics it was created with
+        metrics = ApiAccess.http_metrics
+        metrics.reset()
+        api_access = ApiAccess()
+        for i in range(1, 6):
+            await api_access.execute_get_request_async(f"{DataRep.rick_and_morty_base_url}episode/{i}")
+
+        summary = metrics.summary()
+        assert summary['requests'] == 5
+        # Sequential requests share one keep-alive connection, which earlier tests may already have opened
+        assert summary['connection_reuse_ratio'] >= 0.8
+        assert summary['ttfb']['p50_ms'] >= 20
+        assert summary['total']['count'] == 5
+        assert summary['bytes_received'] > 0
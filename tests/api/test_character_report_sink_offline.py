@@ -0,0 +1,74 @@
+import asyncio
+import csv
+import json
+import time
+
+import pytest
+
+from Infrastructure.objects.data_classes.character import Character
+from Infrastructure.objects.objects_api.character_report_sink import REPORT_FIELDS, CharacterReportSink
+
+
+def make_character(character_id: int) -> Character:
+    return Character(id=character_id, name=f"Character {character_id}", status='Alive', species='Human',
+                     gender='Female', origin=None, location={'name': 'Earth', 'url': ''}, image='',
+                     episode=[], url=f"https://rickandmortyapi.com/api/character/{character_id}", created='')
+
+
+@pytest.mark.asyncio
+class TestCharacterReportSinkOffline:
+    """CharacterReportSink formats, appends and per-worker files, written to a temp directory."""
+
+    async def test_text_report_overwrites_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        sink = CharacterReportSink(str(tmp_path / 'characters.txt'))
+
+        await sink.write_async([make_character(1), make_character(2)])
+        await sink.write_async([make_character(3)])
+
+        lines = (tmp_path / 'characters.txt').read_text(encoding='utf-8').splitlines()
+        assert lines == CharacterReportSink.render_lines([make_character(3)])
+
+    async def test_jsonl_report_has_one_object_per_character(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        sink = CharacterReportSink(str(tmp_path / 'characters.jsonl'), append=True)
+
+        await sink.write_async([make_character(1)])
+        await sink.write_async([make_character(2)])
+
+        rows = [json.loads(line) for line in (tmp_path / 'characters.jsonl').read_text(encoding='utf-8').splitlines()]
+        assert [row['id'] for row in rows] == [1, 2]
+        assert set(rows[0]) == set(REPORT_FIELDS)
+
+    async def test_overlapping_csv_appends_write_the_header_once(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        sink = CharacterReportSink(str(tmp_path / 'characters.csv'), append=True)
+        write_text = sink._write_text
+
+        def slow_disk_write_text(text: str) -> None:
+            time.sleep(0.05)
+            write_text(text)
+
+        # A slow disk keeps every write in flight while the others are being prepared
+        monkeypatch.setattr(sink, '_write_text', slow_disk_write_text)
+        await asyncio.gather(*(sink.write_async([make_character(character_id)]) for character_id in range(1, 9)))
+
+        with open(tmp_path / 'characters.csv', encoding='utf-8', newline='') as file:
+            rows = list(csv.reader(file))
+        assert rows[0] == list(REPORT_FIELDS)
+        assert sorted(int(row[0]) for row in rows[1:]) == list(range(1, 9))
+
+    async def test_each_xdist_worker_writes_its_own_file(self, tmp_path, monkeypatch):
+        sink = CharacterReportSink(str(tmp_path / 'characters.txt'))
+
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw0')
+        await sink.write_async([make_character(1)])
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw1')
+        await sink.write_async([make_character(2)])
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['characters.gw0.txt', 'characters.gw1.txt']
+        assert 'Character ID is: 2' in (tmp_path / 'characters.gw1.txt').read_text(encoding='utf-8')
+
+    async def test_unknown_format_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            CharacterReportSink(str(tmp_path / 'characters.xml'))
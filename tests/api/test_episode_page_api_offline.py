@@ -0,0 +1,323 @@
+import asyncio
+import json
+import os
+import random
+import time
+
+import pytest
+
+from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess, ApiRequestError
+from Infrastructure.Infra.dal.api_access.cassette import Cassette
+from Infrastructure.Infra.dal.api_access.fetch_scheduler import FetchScheduler
+from Infrastructure.Infra.dal.data_reposetory.data_rep import DataRep
+from Infrastructure.Infra.dal.fake_api.fake_dataset import FakeDataset, FakeEpisode
+from Infrastructure.Infra.dal.fake_api.fake_rick_and_morty_server import FakeRickAndMortyServer, FakeServerSettings
+from Infrastructure.Infra.utils.tracing import tracer
+from Infrastructure.objects.data_classes.character import Character, FrozenCharacter
+from Infrastructure.objects.data_classes.model_decoder import ModelDecoder
+from Infrastructure.objects.objects_api.dataset_sync import DatasetSnapshot, DatasetSync
+from Infrastructure.objects.objects_api.episode_page_api import EpisodePageApi
+
+
+@pytest.mark.asyncio
+class TestEpisodePageApiOffline:
+    """EpisodePageApi against the local fake Rick and Morty API."""
+
+    async def test_randomly_choose_two_characters_offline(self, fake_api, tmp_path):
+        episode_page_api = EpisodePageApi()
+
+        selected_characters_details: list[Character] = \
+            await episode_page_api.randomly_choose_two_characters_pipe_async()
+
+        assert len(selected_characters_details) == 2
+        assert selected_characters_details[0].id != selected_characters_details[1].id
+        # The report of fake characters goes to the test's temp directory, not the tracked file
+        assert episode_page_api.report_sink.path.startswith(str(tmp_path))
+        assert os.path.getsize(episode_page_api.report_sink.path) > 0
+
+    async def test_pipeline_fetches_only_the_sampled_characters(self, fake_api):
+        selected = await EpisodePageApi(rng=random.Random(7)).randomly_choose_two_characters_pipe_async()
+        selected_again = await EpisodePageApi(rng=random.Random(7)).randomly_choose_two_characters_pipe_async()
+
+        assert [character.id for character in selected] == [character.id for character in selected_again]
+        # Episode list, the two episodes, then one multi-ID request for the two picks; the rerun hits the cache
+        assert fake_api.request_count == 2 * 3 + 1
+
+    async def test_recorded_pipeline_replays_strictly(self, fake_api, monkeypatch, tmp_path):
+        cassette_path = str(tmp_path / 'pipeline.json.gz')
+        recorder = Cassette(cassette_path, mode=Cassette.RECORD)
+        monkeypatch.setattr(ApiAccess, 'cassette', recorder)
+        recorded = await EpisodePageApi().randomly_choose_two_characters_pipe_async()
+        recorder.save()
+
+        EpisodePageApi.character_cache.clear()
+        fake_api.reset(FakeServerSettings(error_rate=1.0))
+        monkeypatch.setattr(ApiAccess, 'cassette', Cassette(cassette_path))
+        replayed = await EpisodePageApi().randomly_choose_two_characters_pipe_async()
+
+        assert [character.id for character in replayed] == [character.id for character in recorded]
+        assert fake_api.request_count == 0
+
+    async def test_sampling_replaces_characters_that_cannot_be_fetched(self, fake_api):
+        missing_urls = [f"{DataRep.rick_and_morty_base_url}character/{i}" for i in range(90001, 90011)]
+        existing_url = f"{DataRep.rick_and_morty_base_url}character/4"
+
+        selected = await EpisodePageApi(rng=random.Random(1)).sample_characters_async(
+            missing_urls + [existing_url], num=1, max_fallback_rounds=len(missing_urls))
+
+        assert [character.id for character in selected] == [4]
+
+    async def test_lazy_character_load_only_fetches_references(self, fake_api):
+        episode_page_api = EpisodePageApi()
+        episode_urls = [f"{DataRep.rick_and_morty_base_url}episode/{i}" for i in (1, 2)]
+
+        references = await episode_page_api.get_character_references_async(episode_urls)
+        first = await references[0].load()
+
+        assert first.id == references[0].id
+        assert all(reference.is_loaded for reference in references)
+        # Both episodes, then a single multi-ID request for every distinct character they list
+        assert fake_api.request_count == 3
+
+    async def test_fetch_all_characters_uses_one_multi_id_request(self, fake_api):
+        episode_page_api = EpisodePageApi()
+        character_urls = [f"{DataRep.rick_and_morty_base_url}character/{i}" for i in [3, 1, 2, 3, 1, 5]]
+
+        characters = await episode_page_api.fetch_all_characters_async(character_urls)
+
+        assert [character.id for character in characters] == [3, 1, 2, 5]
+        assert fake_api.request_count == 1
+
+    async def test_frozen_decoder_returns_hashable_immutable_characters(self, fake_api):
+        episode_page_api = EpisodePageApi(model_decoder=ModelDecoder(frozen=True))
+        character_urls = [f"{DataRep.rick_and_morty_base_url}character/{i}" for i in (6, 7)]
+
+        characters = await episode_page_api.fetch_scheduler.run(episode_page_api.fetch_character_details,
+                                                                character_urls)
+
+        assert all(isinstance(character, FrozenCharacter) for character in characters)
+        assert len({hash(character) for character in characters}) == 2
+        with pytest.raises(AttributeError):
+            characters[0].episode.append('extra')
+        with pytest.raises(TypeError):
+            characters[0].origin['name'] = 'changed'
+
+    async def test_shared_character_cache_is_separate_per_decoder_and_base_url(self, fake_api, monkeypatch):
+        character_url = f"{DataRep.rick_and_morty_base_url}character/1"
+
+        plain = await EpisodePageApi().fetch_all_characters_async([character_url])
+        frozen = await EpisodePageApi(model_decoder=ModelDecoder(frozen=True)).fetch_all_characters_async(
+            [character_url])
+        with FakeRickAndMortyServer(FakeDataset.generate(characters=5, episodes=1)) as other_server:
+            monkeypatch.setattr(DataRep, 'rick_and_morty_base_url', other_server.base_url)
+            other = await EpisodePageApi().fetch_all_characters_async([f"{other_server.base_url}character/1"])
+
+        assert type(plain[0]) is Character
+        assert type(frozen[0]) is FrozenCharacter
+        assert other[0].url == f"{other_server.base_url}character/1"
+        assert fake_api.request_count == 2
+        assert other_server.request_count == 1
+
+    async def test_episode_characters_are_fetched_while_episodes_stream_in(self, fake_api, monkeypatch):
+        fake_api.reset(FakeServerSettings(latency=0.02))
+        episode_page_api = EpisodePageApi()
+        episode_urls = [f"{DataRep.rick_and_morty_base_url}episode/{i}" for i in range(1, 6)]
+        episode_arrivals = []
+        fetch_starts = []
+        requested_ids = []
+
+        get_request_async = episode_page_api.scheduled_api_access.execute_get_request_async
+        fetch_by_ids_async = episode_page_api.character_batcher.fetch_by_ids_async
+
+        async def staggered_get_request_async(url):
+            data = await get_request_async(url)
+            if url in episode_urls:
+                # Later episodes answer later, so the stream has something to overlap with
+                await asyncio.sleep(0.05 * episode_urls.index(url))
+                episode_arrivals.append(time.perf_counter())
+            return data
+
+        async def recording_fetch_by_ids_async(character_ids):
+            fetch_starts.append(time.perf_counter())
+            requested_ids.extend(character_ids)
+            return await fetch_by_ids_async(character_ids)
+
+        monkeypatch.setattr(episode_page_api.scheduled_api_access, 'execute_get_request_async',
+                            staggered_get_request_async)
+        monkeypatch.setattr(episode_page_api.character_batcher, 'fetch_by_ids_async', recording_fetch_by_ids_async)
+
+        characters = await episode_page_api.fetch_characters_from_episodes_async(episode_urls)
+
+        expected_ids = sorted({character_id for episode in fake_api.dataset.episodes[:5]
+                               for character_id in episode.character_ids})
+        assert [character.id for character in characters] == expected_ids
+        assert sorted(requested_ids) == expected_ids
+        assert min(fetch_starts) < max(episode_arrivals)
+
+    async def test_slow_first_episode_does_not_hold_back_the_others(self, fake_api, monkeypatch):
+        episode_page_api = EpisodePageApi()
+        episode_urls = [f"{DataRep.rick_and_morty_base_url}episode/{i}" for i in range(1, 6)]
+        slow_episode_arrived = asyncio.Event()
+        batches = []
+
+        get_request_async = episode_page_api.scheduled_api_access.execute_get_request_async
+        fetch_by_ids_async = episode_page_api.character_batcher.fetch_by_ids_async
+
+        async def slow_first_get_request_async(url):
+            data = await get_request_async(url)
+            if url == episode_urls[0]:
+                await asyncio.sleep(0.2)
+                slow_episode_arrived.set()
+            return data
+
+        async def recording_fetch_by_ids_async(character_ids):
+            batches.append((slow_episode_arrived.is_set(), list(character_ids)))
+            return await fetch_by_ids_async(character_ids)
+
+        monkeypatch.setattr(episode_page_api.scheduled_api_access, 'execute_get_request_async',
+                            slow_first_get_request_async)
+        monkeypatch.setattr(episode_page_api.character_batcher, 'fetch_by_ids_async', recording_fetch_by_ids_async)
+
+        characters = await episode_page_api.fetch_characters_from_episodes_async(episode_urls)
+
+        expected_ids = sorted({character_id for episode in fake_api.dataset.episodes[:5]
+                               for character_id in episode.character_ids})
+        assert [character.id for character in characters] == expected_ids
+        # Later episodes were fetched before the first one arrived, each batch with sorted IDs
+        assert not batches[0][0]
+        assert all(ids == sorted(ids) for _, ids in batches)
+
+    async def test_fetch_recovers_from_rate_limiting(self, fake_api):
+        fake_api.reset(FakeServerSettings(latency=0.02, rate_limit=100, rate_limit_burst=5))
+        episode_page_api = EpisodePageApi(fetch_scheduler=FetchScheduler(max_attempts=8))
+        character_urls = [f"{DataRep.rick_and_morty_base_url}character/{i}" for i in range(1, 41)]
+
+        characters = await episode_page_api.fetch_scheduler.run(episode_page_api.fetch_character_details,
+                                                                character_urls)
+
+        assert [character.id for character in characters] == list(range(1, 41))
+        assert episode_page_api.fetch_scheduler.stats.throttled > 0
+
+    async def test_server_errors_are_retried_by_the_scheduler_only(self, fake_api):
+        fake_api.reset(FakeServerSettings(error_rate=1.0, error_status=503))
+        episode_page_api = EpisodePageApi(fetch_scheduler=FetchScheduler(max_attempts=4, base_backoff=0.01))
+
+        with pytest.raises(ApiRequestError) as error:
+            await episode_page_api.fetch_all_characters_async([f"{DataRep.rick_and_morty_base_url}character/1"])
+
+        assert error.value.status == 503
+        # One request per scheduler attempt, ApiAccess does not retry the 503s underneath it
+        assert fake_api.request_count == 4
+        assert episode_page_api.fetch_scheduler.stats.throttled == 4
+
+    async def test_crawler_streams_every_episode(self, fake_api):
+        episode_page_api = EpisodePageApi()
+
+        episode_urls = await episode_page_api.get_all_episode_urls_async()
+
+        assert len(episode_urls) == len(fake_api.dataset.episodes)
+
+    async def test_character_store_picks_pair_sharing_location(self, fake_api):
+        episode_page_api = EpisodePageApi()
+
+        character_store = await episode_page_api.load_character_store_async()
+        first, second = character_store.random_pair_sharing_location()
+
+        assert len(character_store) == len(fake_api.dataset.characters)
+        assert first.id != second.id
+        assert first.location == second.location
+        assert first.id in character_store.ids_where('location', first.location)
+
+    async def test_character_store_group_by_is_a_read_only_snapshot(self, fake_api):
+        character_store = await EpisodePageApi().load_character_store_async()
+        some_character = character_store.get(1)
+
+        groups = character_store.group_by('location')
+        with pytest.raises(KeyError):
+            groups['Nowhere']
+        with pytest.raises(AttributeError):
+            groups[some_character.location].append(99)
+
+        assert 'Nowhere' not in character_store.group_by('location')
+        assert list(groups[some_character.location]) == character_store.ids_where('location', some_character.location)
+
+    async def test_dataset_sync_fetches_only_what_changed(self, fake_api, tmp_path):
+        snapshot = DatasetSnapshot(str(tmp_path / 'dataset.sqlite'))
+        dataset_sync = DatasetSync(snapshot)
+
+        first_sync = await dataset_sync.sync_async()
+        requests_after_first_sync = fake_api.request_count
+        second_sync = await dataset_sync.sync_async()
+
+        assert first_sync == {'character': len(fake_api.dataset.characters), 'episode': len(fake_api.dataset.episodes)}
+        assert second_sync == {'character': 20, 'episode': 20}
+        assert fake_api.request_count - requests_after_first_sync == 2
+        assert len(snapshot.load_character_store()) == len(fake_api.dataset.characters)
+        snapshot.close()
+
+    async def test_dataset_sync_refetches_characters_of_a_new_episode(self, monkeypatch, tmp_path):
+        dataset = FakeDataset.generate(characters=60, episodes=5)
+        with FakeRickAndMortyServer(dataset) as server:
+            monkeypatch.setattr(DataRep, 'rick_and_morty_base_url', server.base_url)
+            snapshot = DatasetSnapshot(str(tmp_path / 'dataset.sqlite'))
+            dataset_sync = DatasetSync(snapshot)
+            await dataset_sync.sync_async()
+
+            dataset.episodes.append(FakeEpisode(id=6, name='Episode 6', air_date='December 6, 2013',
+                                                episode='S01E06', character_ids=[45, 50]))
+            for character_id in (45, 50):
+                dataset.characters[character_id - 1].episode_ids.append(6)
+            server.refresh()
+            server.reset()
+
+            await dataset_sync.sync_async()
+            character_store = snapshot.load_character_store()
+            snapshot.close()
+
+        new_episode_url = f"{server.base_url}episode/6"
+        assert [character.id for character in character_store.characters_in_episode(new_episode_url)] == [45, 50]
+        # Both first pages (the new episode is on the first one), then one multi-ID request for its cast
+        assert server.request_count == 3
+
+    async def test_dataset_sync_handles_id_gaps_and_deletions(self, monkeypatch, tmp_path):
+        dataset = FakeDataset.generate(characters=60, episodes=5)
+        self._remove_character(dataset, 7)
+        with FakeRickAndMortyServer(dataset) as server:
+            monkeypatch.setattr(DataRep, 'rick_and_morty_base_url', server.base_url)
+            snapshot = DatasetSnapshot(str(tmp_path / 'dataset.sqlite'))
+            dataset_sync = DatasetSync(snapshot)
+            await dataset_sync.sync_async()
+            synced_ids = sorted(snapshot.bodies_by_id('character'))
+
+            self._remove_character(dataset, 30)
+            server.refresh()
+            await dataset_sync.sync_async()
+            resynced_ids = sorted(snapshot.bodies_by_id('character'))
+            snapshot.close()
+
+        assert synced_ids == [i for i in range(1, 61) if i != 7]
+        assert resynced_ids == [i for i in range(1, 61) if i not in (7, 30)]
+
+    @staticmethod
+    def _remove_character(dataset: FakeDataset, character_id: int) -> None:
+        dataset.characters = [character for character in dataset.characters if character.id != character_id]
+        for episode in dataset.episodes:
+            if character_id in episode.character_ids:
+                episode.character_ids.remove(character_id)
+
+    async def test_pipeline_trace_covers_stages_and_http_calls(self, fake_api, monkeypatch, tmp_path):
+        monkeypatch.setattr(tracer, 'enabled', True)
+        recorded_before = len(tracer.events)
+
+        await EpisodePageApi().randomly_choose_two_characters_pipe_async()
+
+        events = tracer.events[recorded_before:]
+        spans = {event['name'] for event in events if event['ph'] == 'X'}
+        assert {'randomly_choose_two_characters_pipe', 'episodes', 'character_urls', 'sample_characters',
+                'print_write', 'GET'} <= spans
+        # Concurrent requests run in their own tasks and so land on separate tracks
+        assert len({event['tid'] for event in events if event['name'] == 'GET'}) > 1
+
+        trace_path = tmp_path / 'trace.json'
+        tracer.export(str(trace_path))
+        assert json.loads(trace_path.read_text())['traceEvents']
@@ -0,0 +1,91 @@
+import asyncio
+
+from Infrastructure.Infra.dal.api_access.fetch_scheduler import FetchScheduler
+from Infrastructure.Infra.dal.data_reposetory.data_rep import DataRep
+from Infrastructure.Infra.dal.fake_api.fake_rick_and_morty_server import FakeServerSettings
+from Infrastructure.Infra.utils.background_loop import BackgroundEventLoop
+from Infrastructure.objects.objects_api.episode_page_api import EpisodePageApi
+from Infrastructure.objects.objects_api.episode_page_api_sync import EpisodePageApiSync
+
+
+class TestEpisodePageApiSyncOffline:
+    """Blocking EpisodePageApi facade against the local fake Rick and Morty API."""
+
+    def test_sync_pipeline_reuses_one_background_loop(self, fake_api):
+        with EpisodePageApiSync() as episode_page_api:
+            first = episode_page_api.randomly_choose_two_characters_pipe()
+            loop = episode_page_api.background_loop.loop
+            second = episode_page_api.randomly_choose_two_characters_pipe()
+
+            assert episode_page_api.background_loop.loop is loop
+            assert len(first) == len(second) == 2
+
+        assert not episode_page_api.background_loop.is_running
+
+    def test_future_runs_while_caller_keeps_working(self, fake_api):
+        fake_api.reset(FakeServerSettings(latency=0.05))
+
+        with EpisodePageApiSync() as episode_page_api:
+            future = episode_page_api.randomly_choose_two_characters_pipe_future()
+            caller_free = not future.done()
+
+            selected_characters = future.result(timeout=30)
+
+        assert caller_free
+        assert len(selected_characters) == 2
+
+    def test_lazy_characters_load_pending_siblings_in_one_request(self, fake_api):
+        episode_page_api = EpisodePageApi()
+        character_urls = [f"{DataRep.rick_and_morty_base_url}character/{i}" for i in range(1, 31)]
+
+        references = episode_page_api.reference_characters(character_urls)
+        ids = [reference.id for reference in references]
+        assert fake_api.request_count == 0
+
+        name = references[5].name
+
+        assert ids == list(range(1, 31))
+        assert name == fake_api.dataset.characters[5].name
+        assert all(reference.is_loaded for reference in references)
+        assert fake_api.request_count == 1
+
+    def test_lazy_references_resolve_on_the_facade_loop(self, fake_api):
+        fake_api.reset(FakeServerSettings(latency=0.05))
+        character_urls = [f"{DataRep.rick_and_morty_base_url}character/{i}" for i in range(1, 21)]
+
+        with EpisodePageApiSync() as episode_page_api:
+            references = episode_page_api.episode_page_api.reference_characters(character_urls[:10])
+            fetch = episode_page_api.submit(episode_page_api.episode_page_api.fetch_all_characters_async,
+                                            character_urls[10:])
+            name = references[0].name
+            characters = fetch.result(timeout=30)
+
+            assert episode_page_api.episode_page_api.character_resolver.background_loop \
+                is episode_page_api.background_loop
+
+        assert name == fake_api.dataset.characters[0].name
+        assert [character.id for character in characters] == list(range(11, 21))
+        assert episode_page_api.episode_page_api.fetch_scheduler.in_flight == 0
+
+    def test_scheduler_shared_by_two_loops_keeps_separate_counts(self):
+        fetch_scheduler = FetchScheduler(max_concurrency=2)
+        running = {}
+        peaks = {}
+
+        async def fetch(item: int) -> int:
+            loop = asyncio.get_running_loop()
+            running[loop] = running.get(loop, 0) + 1
+            peaks[loop] = max(peaks.get(loop, 0), running[loop])
+            await asyncio.sleep(0.005)
+            running[loop] -= 1
+            return item
+
+        with BackgroundEventLoop(name='first') as first, BackgroundEventLoop(name='second') as second:
+            first_run = first.submit(fetch_scheduler.run(fetch, range(30)))
+            second_run = second.submit(fetch_scheduler.run(fetch, range(30)))
+
+            assert first_run.result(timeout=30) == list(range(30))
+            assert second_run.result(timeout=30) == list(range(30))
+
+        assert list(peaks.values()) == [2, 2]
+        assert fetch_scheduler.in_flight == 0
@@ -1,11 +1,19 @@
 import pytest
+import pytest_asyncio
 import os
 import logging
 from datetime import datetime
-from typing import Generator
+from pytest_asyncio import is_async_test
+from typing import TYPE_CHECKING, AsyncGenerator, Generator
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.events import EventFiringWebDriver, AbstractEventListener
 
+if TYPE_CHECKING:
+    from Infrastructure.Infra.dal.fake_api.fake_rick_and_morty_server import FakeRickAndMortyServer
+    from Infrastructure.Infra.dal.web_driver_extention.web_driver_pool import DriverLease, WebDriverPool
+    from Infrastructure.objects.data_classes.character_store import CharacterStore
+    from Infrastructure.objects.objects_api.episode_page_api_sync import EpisodePageApiSync
+
 
 class WebDriverListener(AbstractEventListener):
     """Custom WebDriver event listener for logging and screenshots."""
@@ -60,20 +68,241 @@ def configure_grid():
     TestSuiteBase.RUN_LOCALLY = os.getenv('RUN_LOCALLY', 'false').lower() == 'true'
 
 
-@pytest.fixture(scope='function')
-def driver_fixture() -> Generator[WebDriver, None, None]:
-    """Provide a WebDriver instance for each test function."""
-    from tests.test_suite_Base import TestSuiteBase
+@pytest.fixture(scope='session', autouse=True)
+def configure_wait_policy():
+    """Configure how DriverEX waits for elements during the test session."""
+    from Infrastructure.Infra.dal.web_driver_extention.wait_policy import WaitPolicy
+    from Infrastructure.Infra.dal.web_driver_extention.web_driver_extension import DriverEX
+    DriverEX.wait_policy = WaitPolicy(timeout=float(os.getenv('WAIT_TIMEOUT', 30)),
+                                      initial_poll=float(os.getenv('WAIT_INITIAL_POLL', 0.005)),
+                                      max_poll=float(os.getenv('WAIT_MAX_POLL', 0.5)),
+                                      adaptive=os.getenv('WAIT_ADAPTIVE', 'true').lower() == 'true')
 
-    logging.info("Setting up WebDriver")
-    driver = None
 
+@pytest.fixture(scope='session', autouse=True)
+def configure_api_access() -> Generator[None, None, None]:
+    """Configure API resilience, the optional response cache, sampling seed and cassette for the test session."""
+    from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess
+    from Infrastructure.Infra.dal.api_access.cassette import Cassette
+    from Infrastructure.Infra.dal.api_access.rate_limiter import SharedTokenBucket
+    from Infrastructure.Infra.dal.api_access.resilience import CircuitBreaker, RetryPolicy, TimeoutSettings
+    from Infrastructure.Infra.dal.api_access.response_cache import ResponseCache
+
+    ApiAccess.retry_policy = RetryPolicy(max_attempts=int(os.getenv('API_MAX_ATTEMPTS', 3)))
+    ApiAccess.timeout_settings = TimeoutSettings(request=float(os.getenv('API_REQUEST_TIMEOUT', 30)),
+                                                 total=float(os.getenv('API_TOTAL_TIMEOUT', 90)))
+    ApiAccess.circuit_breaker = CircuitBreaker(failure_threshold=int(os.getenv('API_CIRCUIT_THRESHOLD', 5)),
+                                               reset_timeout=float(os.getenv('API_CIRCUIT_RESET', 30)))
+
+    # Requests per second for the whole run; every xdist worker shares the same bucket file
+    rate_limit = os.getenv('API_RATE_LIMIT')
+    if rate_limit:
+        bucket_path = os.getenv('API_RATE_LIMIT_PATH',
+                                os.path.join(os.getenv('TEST_RESULTS_DIR', 'test-results'), 'api_rate_limit.bucket'))
+        ApiAccess.rate_limiter = SharedTokenBucket(bucket_path, rate=float(rate_limit),
+                                                   capacity=float(os.getenv('API_RATE_BURST', 1)))
+
+    cache_path = os.getenv('API_CACHE_PATH')
+    if cache_path:
+        ApiAccess.response_cache = ResponseCache(cache_path, ttl=float(os.getenv('API_CACHE_TTL', 24 * 60 * 60)))
+
+    # Seeds the character sampling so a run picks the same characters again, e.g. to reproduce a failure
+    from Infrastructure.objects.objects_api.episode_page_api import EpisodePageApi
+    random_seed = os.getenv('API_RANDOM_SEED')
+    if random_seed:
+        EpisodePageApi.random_seed = int(random_seed)
+
+    cassette_path = os.getenv('API_CASSETTE_PATH')
+    if cassette_path:
+        ApiAccess.cassette = Cassette(cassette_path,
+                                      mode=os.getenv('API_CASSETTE_MODE', Cassette.REPLAY),
+                                      strict=os.getenv('API_CASSETTE_STRICT', 'true').lower() == 'true')
+
+    yield
+
+    if ApiAccess.response_cache is not None:
+        ApiAccess.response_cache.close()
+        ApiAccess.response_cache = None
+
+    if ApiAccess.cassette is not None:
+        ApiAccess.cassette.save()
+        ApiAccess.cassette = None
+
+    from Infrastructure.objects.objects_api.lazy_character_resolver import LazyCharacterResolver
+    LazyCharacterResolver.background_loop.stop(cleanup=ApiAccess.close)
+
+    if ApiAccess.rate_limiter is not None:
+        logging.info(f"API rate limiter: {ApiAccess.rate_limiter.acquired} requests, "
+                     f"{ApiAccess.rate_limiter.waited:.2f}s spent waiting")
+        ApiAccess.rate_limiter.close()
+        ApiAccess.rate_limiter = None
+
+
+@pytest.fixture(scope='session', autouse=True)
+def configure_tracing() -> Generator[None, None, None]:
+    """Record pipeline and HTTP spans when TRACE_PATH is set and write them as Chrome trace-event JSON."""
+    from Infrastructure.Infra.utils.tracing import tracer
+
+    trace_path = os.getenv('TRACE_PATH')
+    if not trace_path:
+        yield
+        return
+
+    worker_id = os.getenv('PYTEST_XDIST_WORKER')
+    if worker_id:
+        root, extension = os.path.splitext(trace_path)
+        trace_path = f"{root}.{worker_id}{extension}"
+
+    tracer.enabled = True
+    yield
+    tracer.enabled = False
+
+    tracer.export(trace_path)
+    logging.info(f"Trace written to {trace_path}, open it in chrome://tracing or ui.perfetto.dev")
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session's event loop, so pooled connections outlive single tests."""
+    session_loop = pytest.mark.asyncio(loop_scope='session')
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope='session', loop_scope='session', autouse=True)
+async def api_session() -> AsyncGenerator[None, None]:
+    """Share one pooled aiohttp session across the API calls of the whole test session."""
+    from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess
+
+    yield
+    await ApiAccess.close()
+
+
+@pytest.fixture(autouse=True)
+def http_metrics(request) -> Generator[None, None, None]:
+    """Collect the test's HTTP phase timings from ApiAccess for the HTML report."""
+    from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess
+
+    metrics = ApiAccess.http_metrics
+    if metrics is not None:
+        metrics.reset()
+
+    yield
+
+    if metrics is not None and metrics.requests:
+        summary = metrics.summary()
+        request.node.user_properties.append(('http_metrics', summary))
+        logging.info(f"HTTP metrics for {request.node.name}: {summary}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach the HTTP metrics summary collected by the http_metrics fixture to the HTML report."""
+    outcome = yield
+    report = outcome.get_result()
+
+    pytest_html = item.config.pluginmanager.getplugin('html')
+    summary = dict(item.user_properties).get('http_metrics')
+    if report.when != 'teardown' or pytest_html is None or summary is None:
+        return
+
+    rows = ''.join(
+        f"<tr><td>{phase}</td><td>{timings['count']}</td><td>{timings['p50_ms']}</td><td>{timings['p95_ms']}</td>"
+        f"<td>{timings['p99_ms']}</td><td>{timings['max_ms']}</td></tr>"
+        for phase, timings in summary.items() if isinstance(timings, dict)
+    )
+    report.extras = getattr(report, 'extras', []) + [pytest_html.extras.html(
+        f"<div><p>HTTP requests: {summary['requests']}, errors: {summary['errors']}, "
+        f"bytes: {summary['bytes_received']}, connection reuse: {summary['connection_reuse_ratio']:.0%}</p>"
+        f"<table><tr><th>phase</th><th>count</th><th>p50 ms</th><th>p95 ms</th><th>p99 ms</th><th>max ms</th></tr>"
+        f"{rows}</table></div>"
+    )]
+
+
+@pytest.fixture(scope='session')
+def fake_api_server() -> Generator['FakeRickAndMortyServer', None, None]:
+    """Start the local stand-in Rick and Morty API once for the test session."""
+    from Infrastructure.Infra.dal.fake_api.fake_rick_and_morty_server import FakeRickAndMortyServer
+
+    with FakeRickAndMortyServer() as server:
+        logging.info(f"Fake Rick and Morty API listening on {server.base_url}")
+        yield server
+
+
+@pytest.fixture
+def fake_api(fake_api_server, monkeypatch, tmp_path) -> Generator['FakeRickAndMortyServer', None, None]:
+    """Point DataRep.rick_and_morty_base_url at the fake API, with default settings and fresh counters.
+
+    Character reports go to a temporary file, so fake data never overwrites the tracked report.
+    """
+    from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess
+    from Infrastructure.Infra.dal.data_reposetory.data_rep import DataRep
+    from Infrastructure.objects.objects_api.character_report_sink import CharacterReportSink
+    from Infrastructure.objects.objects_api.episode_page_api import EpisodePageApi
+
+    fake_api_server.reset()
+    EpisodePageApi.character_cache.clear()
+    if ApiAccess.circuit_breaker is not None:
+        ApiAccess.circuit_breaker.reset()
+    monkeypatch.setattr(DataRep, 'rick_and_morty_base_url', fake_api_server.base_url)
+    monkeypatch.setattr(CharacterReportSink, 'default_filename', str(tmp_path / 'characters_introduction.txt'))
+
+    yield fake_api_server
+
+    EpisodePageApi.character_cache.clear()
+
+
+@pytest.fixture(scope='session')
+def episode_page_api_sync() -> Generator['EpisodePageApiSync', None, None]:
+    """Blocking API client for sync UI tests, backed by one background event-loop thread for the session."""
+    from Infrastructure.objects.objects_api.episode_page_api_sync import EpisodePageApiSync
+
+    with EpisodePageApiSync() as api:
+        yield api
+
+
+@pytest.fixture(scope='session')
+def character_store() -> 'CharacterStore':
+    """Load the indexed character set from the local dataset snapshot instead of the network."""
+    from Infrastructure.objects.objects_api.dataset_sync import DatasetSnapshot
+
+    snapshot_path = os.getenv('DATASET_SNAPSHOT_PATH', os.path.join('test-results', 'dataset.sqlite'))
+    if not os.path.exists(snapshot_path):
+        pytest.skip(f"No dataset snapshot at {snapshot_path}, "
+                    f"run: python -m Infrastructure.objects.objects_api.dataset_sync --snapshot {snapshot_path}")
+
+    snapshot = DatasetSnapshot(snapshot_path)
     try:
-        base_driver = TestSuiteBase.get_driver()
+        return snapshot.load_character_store()
+    finally:
+        snapshot.close()
+
 
-        # Instead of maximize_window(), set specific window size
-        base_driver.set_window_size(1920, 1080)
+@pytest.fixture(scope='session')
+def web_driver_pool() -> Generator['WebDriverPool', None, None]:
+    """Keep warm WebDriver sessions for the worker, reused across test functions."""
+    from Infrastructure.Infra.dal.web_driver_extention.web_driver_pool import WebDriverPool
+    from tests.test_suite_Base import TestSuiteBase
+
+    pool = WebDriverPool(TestSuiteBase.get_driver,
+                         size=int(os.getenv('DRIVER_POOL_SIZE', 1)),
+                         max_uses=int(os.getenv('DRIVER_MAX_USES', 20)),
+                         dispose=TestSuiteBase.driver_dispose)
+    with pool:
+        yield pool
+
+    TestSuiteBase.stop_chrome_service()
 
+
+@pytest.fixture(scope='function')
+def driver_fixture(web_driver_pool) -> Generator[WebDriver, None, None]:
+    """Lease a warm WebDriver from the session pool for each test function."""
+    logging.info("Leasing WebDriver from the pool")
+    base_driver = None
+    driver = None
+
+    try:
+        base_driver = web_driver_pool.acquire()
         driver = EventFiringWebDriver(base_driver, WebDriverListener())
 
         yield driver
@@ -93,12 +322,29 @@ def driver_fixture() -> Generator[WebDriver, None, None]:
         raise
 
     finally:
-        if driver:
-            logging.info("Cleaning up WebDriver")
+        if base_driver:
+            logging.info("Returning WebDriver to the pool")
             try:
-                TestSuiteBase.driver_dispose(driver.wrapped_driver)
+                # The pool resets the session for the next test, or quits it if it no longer answers
+                web_driver_pool.release(base_driver)
             except Exception as e:
-                logging.error(f"Error during WebDriver cleanup: {str(e)}")
+                logging.error(f"Error returning WebDriver to the pool: {str(e)}")
+
+
+@pytest.fixture(scope='function')
+def prewarmed_driver(web_driver_pool) -> Generator['DriverLease', None, None]:
+    """Start leasing a WebDriver on a background thread; call .result() once the test needs the browser."""
+    logging.info("Launching WebDriver in the background")
+    lease = web_driver_pool.acquire_in_background(wrap=lambda base_driver: EventFiringWebDriver(base_driver,
+                                                                                               WebDriverListener()))
+
+    yield lease
+
+    logging.info("Returning WebDriver to the pool")
+    try:
+        lease.release()
+    except Exception as e:
+        logging.error(f"Error returning WebDriver to the pool: {str(e)}")
 
 
 def pytest_sessionfinish(session, exitstatus):
@@ -119,6 +365,13 @@ def pytest_sessionfinish(session, exitstatus):
         logging.info(f"Skipped: {skipped}")
         logging.info(f"Exit status: {exitstatus}")
 
+        from Infrastructure.Infra.dal.api_access.api_accsess import ApiAccess
+        logging.info(f"API resilience: {ApiAccess.resilience_stats.summary()}")
+
+        from Infrastructure.Infra.dal.web_driver_extention.web_driver_extension import DriverEX
+        for locator, wait_stats in DriverEX.wait_policy.slowest():
+            logging.info(f"Element wait {locator}: {wait_stats}")
+
     except Exception as e:
         logging.error(f"Error generating test summary: {str(e)}")
 
@@ -9,10 +9,13 @@ from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 from selenium.webdriver.remote.webdriver import WebDriver
-from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.core.os_manager import ChromeType
 
+from Infrastructure.Infra.dal.web_driver_extention.chrome_driver_resolver import ChromeDriverResolver, SharedChromeService
+
 
 class TestSuiteBase:
     # Logging setup
@@ -40,6 +43,12 @@ class TestSuiteBase:
     IS_GITHUB_ACTIONS = os.getenv('GITHUB_ACTIONS', '').lower() == 'true'
     RUN_LOCALLY = os.getenv('RUN_LOCALLY', 'true').lower() == 'true'
 
+    # ChromeDriver is resolved once per worker and, by default, served by one long-lived process
+    driver_resolver = ChromeDriverResolver(cache_dir=os.getenv('CHROMEDRIVER_CACHE_DIR'),
+                                           offline=os.getenv('CHROMEDRIVER_OFFLINE', 'false').lower() == 'true')
+    chrome_service = SharedChromeService(driver_resolver)
+    SHARE_CHROME_SERVICE = os.getenv('SHARE_CHROME_SERVICE', 'true').lower() == 'true'
+
     @classmethod
     def get_driver(cls) -> WebDriver:
         """Creates and returns a WebDriver instance based on configuration."""
@@ -75,15 +84,29 @@ class TestSuiteBase:
             chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
             chrome_options.add_experimental_option('useAutomationExtension', False)
 
-            # Attempt to get ChromeDriver with automatic version matching
-            service = ChromeService(ChromeDriverManager().install())
-
-            cls.logger.info(f"Using ChromeDriver from: {service.path}")
-
-            driver = webdriver.Chrome(
-                service=service,
-                options=chrome_options
-            )
+            if cls.SHARE_CHROME_SERVICE:
+                # Only the browser is spawned, the chromedriver process is shared by the worker's sessions.
+                # The Chromium connection keeps Chrome-only commands such as CDP available.
+                service_url = cls.chrome_service.service_url
+                cls.logger.info(f"Using shared ChromeDriver service at: {service_url}")
+
+                driver = webdriver.Remote(
+                    command_executor=ChromiumRemoteConnection(
+                        remote_server_addr=service_url,
+                        vendor_prefix='goog',
+                        browser_name=DesiredCapabilities.CHROME['browserName']
+                    ),
+                    options=chrome_options
+                )
+            else:
+                service = ChromeService(cls.driver_resolver.resolve())
+
+                cls.logger.info(f"Using ChromeDriver from: {service.path}")
+
+                driver = webdriver.Chrome(
+                    service=service,
+                    options=chrome_options
+                )
 
             # Explicitly set window size
             driver.set_window_size(1920, 1080)
@@ -124,6 +147,11 @@ class TestSuiteBase:
             except Exception as e:
                 cls.logger.error(f"Error disposing WebDriver: {str(e)}")
 
+    @classmethod
+    def stop_chrome_service(cls) -> None:
+        """Stops the worker's shared ChromeDriver process, if one was started."""
+        cls.chrome_service.stop()
+
     @staticmethod
     def get_web_driver_options() -> ChromeOptions:
         """Configures Chrome options with enhanced compatibility."""
@@ -3,22 +3,21 @@ from time import sleep
 import pytest
 
 from Infrastructure.Infra.dal.data_reposetory.data_rep import DataRep
-from Infrastructure.objects.objects_api.episode_page_api import EpisodePageApi
 from Infrastructure.objects.objects_ui.google_home_page_ui import GoogleHomePageUi
 
 
-@pytest.mark.asyncio
 class TestVerifyCharacterLocation:
     """Test class to verify character locations."""
 
     @pytest.mark.regression
-    async def test_verify_characters_location_is_the_same_ui(self, driver_fixture ):
+    def test_verify_characters_location_is_the_same_ui(self, prewarmed_driver, episode_page_api_sync):
         """Verify that two randomly selected characters have the same location."""
-        driver = driver_fixture
+        # The browser is already launching in the background; fetch character details meanwhile
+        character_details_future = episode_page_api_sync.randomly_choose_two_characters_pipe_future()
 
-        # Fetch character details from the API
-        episode_page_api = EpisodePageApi()
-        character_details = await episode_page_api.randomly_choose_two_characters_pipe_async()
+        driver = prewarmed_driver.result()
+        driver.get(DataRep.google_home_page_url)
+        character_details = character_details_future.result()
 
         # Character 1 details
         character_1 = character_details[0]
@@ -26,8 +25,7 @@ class TestVerifyCharacterLocation:
         character_1_name = character_1.name
         character_1_location = character_1.location
 
-        # Navigate to Google Home Page and search for Character 1
-        driver.get(DataRep.google_home_page_url)
+        # Search for Character 1 from the Google Home Page
         google_home_page = GoogleHomePageUi(driver)
         google_search_image_page = google_home_page.click_on_images_link()
         sleep(1)
@@ -53,3 +51,23 @@ class TestVerifyCharacterLocation:
 
         # Assert that both characters have the same location
         assert True == True
+
+    @pytest.mark.regression
+    def test_verify_characters_from_snapshot_share_location_ui(self, character_store, prewarmed_driver):
+        """Verify two characters picked from the dataset snapshot by shared location, without API calls."""
+        character_1, character_2 = character_store.random_pair_sharing_location()
+
+        driver = prewarmed_driver.result()
+        driver.get(DataRep.google_home_page_url)
+
+        # Search for Character 1 from the Google Home Page
+        google_home_page = GoogleHomePageUi(driver)
+        google_search_image_page = google_home_page.click_on_images_link()
+        sleep(1)
+        google_search_image_page.set_image_name(character_1.name)
+
+        # Assert that both characters have the same location
+        assert character_1.id != character_2.id
+        assert character_1.location == character_2.location, \
+            (f"Character 1 location: {character_1.location} ({character_1.name}) vs "
+             f"Character 2 location: {character_2.location} ({character_2.name}).")
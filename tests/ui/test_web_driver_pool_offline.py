@@ -0,0 +1,148 @@
+import threading
+import time
+
+import pytest
+from selenium.common import WebDriverException
+
+from Infrastructure.Infra.dal.web_driver_extention.web_driver_pool import WebDriverPool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver: 'FakeDriver') -> None:
+        self.driver = driver
+
+    def window(self, handle: str) -> None:
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Stand-in WebDriver recording the calls the pool makes, no browser needed."""
+
+    def __init__(self, launch_delay: float = 0.0) -> None:
+        time.sleep(launch_delay)
+        self.window_handles = ['main']
+        self.current_window_handle = 'main'
+        self.switch_to = FakeSwitchTo(self)
+        self.current_url = 'about:blank'
+        self.alive = True
+        self.quit_called = False
+        self.cdp_commands = []
+
+    def open_tab(self) -> None:
+        self.window_handles.append(f"tab-{len(self.window_handles)}")
+
+    def close(self) -> None:
+        self.window_handles.remove(self.current_window_handle)
+
+    def execute_script(self, script: str, *args):
+        if not self.alive:
+            raise WebDriverException('session deleted because of page crash')
+        return 1
+
+    def execute(self, command: str, params: dict):
+        self.cdp_commands.append(params['cmd'])
+
+    def delete_all_cookies(self) -> None:
+        pass
+
+    def get(self, url: str) -> None:
+        self.current_url = url
+
+    def set_window_size(self, width: int, height: int) -> None:
+        pass
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+class TestWebDriverPoolOffline:
+    """WebDriverPool leasing rules, driven with fake drivers."""
+
+    def test_pool_never_exceeds_size_and_times_out_when_exhausted(self):
+        with WebDriverPool(FakeDriver, size=2) as pool:
+            first, second = pool.acquire(), pool.acquire()
+
+            with pytest.raises(TimeoutError):
+                pool.acquire(timeout=0.1)
+
+            assert first is not second
+            assert pool.stats.created == 2
+
+    def test_released_session_is_reset_and_reused(self):
+        with WebDriverPool(FakeDriver, size=1) as pool:
+            driver = pool.acquire()
+            driver.open_tab()
+            driver.get('https://www.google.com')
+            pool.release(driver)
+
+            assert pool.acquire() is driver
+            assert driver.window_handles == ['main']
+            assert driver.cdp_commands == ['Network.clearBrowserCookies']
+            assert driver.current_url == WebDriverPool.BLANK_PAGE
+            assert pool.stats.reused == 1
+
+    def test_session_is_recycled_after_max_uses(self):
+        with WebDriverPool(FakeDriver, size=1, max_uses=2) as pool:
+            first = pool.acquire()
+            pool.release(first)
+            pool.release(pool.acquire())
+
+            replacement = pool.acquire()
+
+            assert replacement is not first
+            assert first.quit_called
+            assert pool.stats.recycled == 1
+            assert pool.stats.created == 2
+
+    def test_unhealthy_session_is_replaced(self):
+        with WebDriverPool(FakeDriver, size=1) as pool:
+            crashed = pool.acquire()
+            pool.release(crashed)
+            crashed.alive = False
+
+            replacement = pool.acquire()
+
+            assert replacement is not crashed
+            assert crashed.quit_called
+            assert pool.stats.unhealthy == 1
+
+    def test_concurrent_leases_share_the_pool(self):
+        leased = set()
+        peak = []
+        lock = threading.Lock()
+
+        def lease_repeatedly(pool: WebDriverPool) -> None:
+            for _ in range(10):
+                with pool.lease(timeout=5) as driver:
+                    with lock:
+                        assert driver not in leased
+                        leased.add(driver)
+                        peak.append(len(leased))
+                    time.sleep(0.002)
+                    with lock:
+                        leased.remove(driver)
+
+        with WebDriverPool(lambda: FakeDriver(launch_delay=0.01), size=2) as pool:
+            workers = [threading.Thread(target=lease_repeatedly, args=(pool,)) for _ in range(4)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+            assert len(peak) == 40
+            assert max(peak) <= 2
+            assert pool.stats.created == 2
+            assert pool.stats.leased == 40
+
+    def test_background_acquire_returns_before_the_launch_finishes(self):
+        with WebDriverPool(lambda: FakeDriver(launch_delay=0.2), size=1) as pool:
+            started = time.perf_counter()
+            lease = pool.acquire_in_background(wrap=lambda driver: ('wrapped', driver))
+
+            assert time.perf_counter() - started < 0.1
+            assert not lease.done()
+            label, driver = lease.result(timeout=5)
+            assert label == 'wrapped' and isinstance(driver, FakeDriver)
+
+            lease.release()
+            assert pool.acquire() is driver